@@ -6,23 +6,44 @@ the RAG pipeline's parsing, chunking, embedding, retrieval, and
 hallucination detection capabilities.
 """
 
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, HRFlowable
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Table, TableStyle,
+    PageBreak, CondPageBreak, HRFlowable
 )
+from reportlab.platypus.paraparser import ParaParser
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+import docx
 from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import RGBColor
 from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import copy
+import io
 import os
+import zipfile
 
 OUT_DIR = os.path.dirname(os.path.abspath(__file__))
+_OUT = Path(OUT_DIR)
+
+# Flate-compress page streams, but skip the extra ASCII85 pass over them.
+rl_config.useA85 = 0
+rl_config.pageCompression = 1
+
+# Only core-14 fonts are used, so there is nothing to search for on disk.
+# Load their metrics here so forked pool workers inherit them warm.
+rl_config.T1SearchPath = []
+rl_config.TTFSearchPath = []
+for _font_name in ('Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique'):
+    pdfmetrics.getFont(_font_name)
 
 # ─── reportlab styles ─────────────────────────────────────────
 styles = getSampleStyleSheet()
@@ -43,11 +64,70 @@ styles.add(ParagraphStyle(name='CenterBold', fontSize=10, leading=13,
 styles.add(ParagraphStyle(name='Footer', fontSize=7.5, leading=10,
            textColor=colors.HexColor('#94a3b8'), alignment=TA_CENTER))
 
+# Stick to the core-14 Type1 fonts so nothing is embedded or subset at build time.
+assert all(s.fontName in pdfmetrics.standardFonts for s in styles.byName.values()
+           if hasattr(s, 'fontName'))
+
 AIG_BLUE = colors.HexColor('#00205B')
 LIGHT_BLUE = colors.HexColor('#e8edf5')
 BORDER_GRAY = colors.HexColor('#cbd5e1')
 ROW_ALT = colors.HexColor('#f8fafc')
 RED_FLAG = colors.HexColor('#dc2626')
+FOOTER_GRAY = colors.HexColor('#94a3b8')
+
+
+# Table styles are immutable once built and can be shared by any number of tables.
+_HEADER_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (0, 0), 20),
+    ('TEXTCOLOR', (0, 0), (0, 0), AIG_BLUE),
+    ('FONTNAME', (1, 0), (1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (1, 0), (1, 0), 14),
+    ('TEXTCOLOR', (1, 0), (1, 0), AIG_BLUE),
+    ('FONTSIZE', (1, 1), (1, 1), 9),
+    ('TEXTCOLOR', (1, 1), (1, 1), colors.HexColor('#64748b')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+])
+
+_STYLED_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), AIG_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 8.5),
+    ('FONTSIZE', (0, 1), (-1, -1), 8.5),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 0.5, BORDER_GRAY),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+])
+
+_KV_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1e293b')),
+    ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#334155')),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LINEBELOW', (0, 0), (-1, -2), 0.5, colors.HexColor('#e2e8f0')),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+])
+
+_FIN_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BACKGROUND', (0, 0), (-1, 0), LIGHT_BLUE),
+    ('GRID', (0, 0), (-1, -1), 0.5, BORDER_GRAY),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+])
 
 
 def header_table(title_lines):
@@ -56,126 +136,272 @@ def header_table(title_lines):
         ['', title_lines[1] if len(title_lines) > 1 else ''],
     ]
     t = Table(data, colWidths=[1.2 * inch, 5.3 * inch])
-    t.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (0, 0), 20),
-        ('TEXTCOLOR', (0, 0), (0, 0), AIG_BLUE),
-        ('FONTNAME', (1, 0), (1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (1, 0), (1, 0), 14),
-        ('TEXTCOLOR', (1, 0), (1, 0), AIG_BLUE),
-        ('FONTSIZE', (1, 1), (1, 1), 9),
-        ('TEXTCOLOR', (1, 1), (1, 1), colors.HexColor('#64748b')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    t.setStyle(_HEADER_TABLE_STYLE)
     return t
 
 
 def styled_table(headers, rows, col_widths=None):
-    data = [headers] + rows
+    data = [headers, *rows]
     if not col_widths:
         col_widths = [6.5 * inch / len(headers)] * len(headers)
     t = Table(data, colWidths=col_widths, repeatRows=1)
-    style = [
-        ('BACKGROUND', (0, 0), (-1, 0), AIG_BLUE),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8.5),
-        ('FONTSIZE', (0, 1), (-1, -1), 8.5),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('GRID', (0, 0), (-1, -1), 0.5, BORDER_GRAY),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]
-    for i in range(1, len(data)):
-        if i % 2 == 0:
-            style.append(('BACKGROUND', (0, i), (-1, i), ROW_ALT))
-    t.setStyle(TableStyle(style))
+    t.setStyle(_STYLED_TABLE_STYLE)
+    t.setStyle(_row_bands(len(data)))
     return t
 
 
+@lru_cache(maxsize=None)
+def _row_bands(n_rows):
+    # Explicit per-row fills (rather than ROWBACKGROUNDS) keep the banding
+    # anchored to the data row when a long table splits across pages.
+    return TableStyle([('BACKGROUND', (0, i), (-1, i), ROW_ALT) for i in range(2, n_rows, 2)])
+
+
 def kv_table(pairs, col_widths=None):
     if not col_widths:
         col_widths = [2.2 * inch, 4.3 * inch]
     t = Table(pairs, colWidths=col_widths)
-    style = [
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1e293b')),
-        ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#334155')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LINEBELOW', (0, 0), (-1, -2), 0.5, colors.HexColor('#e2e8f0')),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-    ]
-    t.setStyle(TableStyle(style))
+    t.setStyle(_KV_TABLE_STYLE)
     return t
 
 
+@lru_cache(maxsize=None)
+def _style_frags(style_name):
+    # Bold and plain fragments for a style, parsed once and cloned per
+    # paragraph so fixed-format paragraphs skip the markup parser.
+    return tuple(ParaParser().parse('<b>_</b>_', styles[style_name])[1])
+
+
+def _frag(template, text):
+    return template.clone(text=text, link=[], us_lines=[])
+
+
+def plain_paragraph(text, style_name='BodyText2'):
+    plain = _style_frags(style_name)[1]
+    return Paragraph(None, styles[style_name], frags=[_frag(plain, text)])
+
+
+def label_paragraph(label, text, prefix=''):
+    bold, plain = _style_frags('BodyText2')
+    frags = [_frag(bold, label), _frag(plain, f' {text}')]
+    if prefix:
+        frags.insert(0, _frag(plain, prefix))
+    return Paragraph(None, styles['BodyText2'], frags=frags)
+
+
+_FOOTER_TEXT = 'AIG  |  Confidential  |  Page %d'
+_FOOTER_X = 4.25 * inch
+_FOOTER_Y = 0.4 * inch
+
+
 def add_footer(canvas, doc):
     canvas.saveState()
     canvas.setFont('Helvetica', 7)
-    canvas.setFillColor(colors.HexColor('#94a3b8'))
-    canvas.drawCentredString(4.25 * inch, 0.4 * inch,
-                             f"AIG  |  Confidential  |  Page {doc.page}")
+    canvas.setFillColor(FOOTER_GRAY)
+    canvas.drawCentredString(_FOOTER_X, _FOOTER_Y, _FOOTER_TEXT % doc.page)
     canvas.restoreState()
 
 
+class _PolicyDoc(BaseDocTemplate):
+    """Single-column letter document with one page template carrying the footer."""
+
+    def __init__(self, path):
+        super().__init__(path, pagesize=letter,
+                         topMargin=0.6 * inch, bottomMargin=0.7 * inch,
+                         leftMargin=0.75 * inch, rightMargin=0.75 * inch,
+                         pageCompression=1)
+        body = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='body')
+        self.addPageTemplates([PageTemplate(id='page', frames=[body], onPage=add_footer)])
+
+
+def build_pdf(path, story):
+    """Lay out the story in memory and write the finished PDF in one call."""
+    buf = io.BytesIO()
+    _PolicyDoc(buf).build(story)
+    with open(path, 'wb', buffering=0) as f:
+        f.write(buf.getbuffer())
+
+
 # ─── docx helpers ──────────────────────────────────────────────
 AIG_BLUE_RGB = RGBColor(0x00, 0x20, 0x5B)
 BODY_TEXT_RGB = RGBColor(0x33, 0x41, 0x55)
 MUTED_RGB = RGBColor(0x64, 0x74, 0x8B)
 WHITE_RGB = RGBColor(0xFF, 0xFF, 0xFF)
 
+# python-docx's blank template, read once so each document is parsed from memory
+# instead of reopening the file inside the package.
+_BASE_DOC_BYTES = (Path(docx.__file__).parent / 'templates' / 'default.docx').read_bytes()
+# Its members inflated once at import (before the worker pool forks), for
+# _docx_bytes to copy into every report archive.
+with zipfile.ZipFile(io.BytesIO(_BASE_DOC_BYTES)) as _base:
+    _BASE_MEMBERS = tuple((info.filename, _base.read(info)) for info in _base.infolist())
+del _base
+
+
+def new_document():
+    return Document(io.BytesIO(_BASE_DOC_BYTES))
+
+
+# Run formats are (bold, italic, size_half_pts, color); None leaves a property unset
+# and bold=False writes an explicit <w:b w:val="0"/>, as python-docx does.
+_HEADING_FMT = (None, None, None, AIG_BLUE_RGB)
+_HEADER_FMT = (True, None, 18, WHITE_RGB)
+_BODY_FMT = (False, None, 20, BODY_TEXT_RGB)
+_BODY_BOLD_FMT = (True, None, 20, BODY_TEXT_RGB)
+_MUTED_FMT = (None, None, 20, MUTED_RGB)
+_NOTE_FMT = (None, True, 17, MUTED_RGB)
+
+
+@lru_cache(maxsize=None)
+def _rpr_xml(fmt):
+    """Return the ``<w:rPr>`` markup for *fmt*, for splicing into XML strings."""
+    bold, italic, size_half_pts, color = fmt
+    return ''.join((
+        '<w:rPr>',
+        '' if bold is None else '<w:b/>' if bold else '<w:b w:val="0"/>',
+        '<w:i/>' if italic else '',
+        f'<w:color w:val="{color}"/>' if color else '',
+        f'<w:sz w:val="{size_half_pts}"/>' if size_half_pts else '',
+        '</w:rPr>',
+    ))
+
+
+_WNS = nsdecls('w')
+_PRESERVE = ' xml:space="preserve"'
+# One C-level pass instead of saxutils.escape's three str.replace calls.
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+_BODY_PPR = '<w:pPr><w:spacing w:after="120"/></w:pPr>'
+
+
+def _text_xml(text):
+    """Return the ``<w:t>``/``<w:br/>`` run content python-docx writes for *text*."""
+    return '<w:br/>'.join(
+        f'<w:t{_PRESERVE if line != line.strip() else ""}>{line.translate(_XML_ESCAPE)}</w:t>' if line else ''
+        for line in text.split('\n')
+    )
+
+
+# Body width of the default python-docx template (8.5in page, 1.25in margins).
+BODY_WIDTH_TWIPS = 8640
+
+_TABLE_GRID_TBLPR = (
+    '<w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" '
+    'w:noVBand="1" w:val="04A0"/></w:tblPr>'
+)
+_CENTER_PPR = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+
+
+def _row_xml(row, col_widths, rprs, shd='', pPr=''):
+    cells = ''.join(
+        f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>{shd}</w:tcPr>'
+        f'<w:p>{pPr}<w:r>{rPr}{_text_xml(text)}</w:r></w:p></w:tc>'
+        for text, width, rPr in zip(row, col_widths, rprs)
+    )
+    return f'<w:tr>{cells}</w:tr>'
+
+
+def build_table_xml(headers, rows, col_widths=None, font_half_pts=18, bold_first_col=False,
+                    bold_last_row=False, header_fill='00205B'):
+    """Build a complete 'Table Grid' ``<w:tbl>`` from one XML string.
+
+    Produces what ``doc.add_table`` plus per-cell ``cell.text`` writes, font
+    sizing and a shaded, centred white-on-blue header row would, with a single
+    parse and no python-docx cell lookups. *headers* may be None for a table
+    without a header row. *col_widths* are in twips and default to an even
+    split of the body width.
+    """
+    return parse_xml(_table_xml(
+        tuple(headers) if headers else None, tuple(map(tuple, rows)),
+        tuple(col_widths) if col_widths else None, font_half_pts, bold_first_col, bold_last_row, header_fill,
+    ))
+
+
+@lru_cache(maxsize=None)
+def _table_xml(headers, rows, col_widths, font_half_pts, bold_first_col, bold_last_row, header_fill):
+    """Return the escaped ``<w:tbl>`` markup behind ``build_table_xml``, once per table."""
+    n_cols = len(headers or rows[0])
+    col_widths = col_widths or [BODY_WIDTH_TWIPS // n_cols] * n_cols
+    plain = [_rpr_xml((None, None, font_half_pts, None))] * n_cols
+    bold = [_rpr_xml((True, None, font_half_pts, None))] * n_cols
+    body_rprs = bold[:1] + plain[1:] if bold_first_col else plain
+    grid = ''.join(f'<w:gridCol w:w="{width}"/>' for width in col_widths)
+    header = _row_xml(headers, col_widths, [_rpr_xml(_HEADER_FMT)] * n_cols,
+                      shd=f'<w:shd w:fill="{header_fill}"/>', pPr=_CENTER_PPR) if headers else ''
+    body = ''.join(_row_xml(row, col_widths, body_rprs) for row in (rows[:-1] if bold_last_row else rows))
+    total = _row_xml(rows[-1], col_widths, bold) if bold_last_row else ''
+    return f'<w:tbl {_WNS}>{_TABLE_GRID_TBLPR}<w:tblGrid>{grid}</w:tblGrid>{header}{body}{total}</w:tbl>'
+
+
+# Fixed paragraphs are parsed once and deep-copied per use, which skips the
+# parse and oxml class lookup of a fresh parse_xml.
+_PAGE_BREAK_P = parse_xml(f'<w:p {_WNS}><w:r><w:br w:type="page"/></w:r></w:p>')
+_BLANK_P = parse_xml(f'<w:p {_WNS}/>')
+
 
-def set_cell_shading(cell, color_hex):
-    shading_elm = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>')
-    cell._tc.get_or_add_tcPr().append(shading_elm)
+def add_page_break(doc):
+    doc.element.body._insert_p(copy.deepcopy(_PAGE_BREAK_P))
 
 
-def style_header_row(row, bg_color='00205B'):
-    for cell in row.cells:
-        set_cell_shading(cell, bg_color)
-        for p in cell.paragraphs:
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            for run in p.runs:
-                run.font.color.rgb = WHITE_RGB
-                run.font.bold = True
-                run.font.size = Pt(9)
+def add_spacer(doc):
+    """Append an empty paragraph, as ``doc.add_paragraph()`` does."""
+    doc.element.body._insert_p(copy.deepcopy(_BLANK_P))
 
 
 def add_heading_styled(doc, text, level=1):
-    h = doc.add_heading(text, level=level)
-    for run in h.runs:
-        run.font.color.rgb = AIG_BLUE_RGB
-    return h
+    """Append what ``doc.add_heading`` writes, with the run coloured AIG blue."""
+    style = 'Title' if level == 0 else f'Heading{level}'
+    doc.element.body._insert_p(parse_xml(
+        f'<w:p {_WNS}><w:pPr><w:pStyle w:val="{style}"/></w:pPr>'
+        f'<w:r>{_rpr_xml(_HEADING_FMT)}{_text_xml(text)}</w:r></w:p>'
+    ))
+
+
+def add_body_batch(doc, texts, bold=False):
+    """Append an ``add_body`` paragraph for each of *texts* from one XML parse."""
+    rPr = _rpr_xml(_BODY_BOLD_FMT if bold else _BODY_FMT)
+    paragraphs = ''.join(f'<w:p>{_BODY_PPR}<w:r>{rPr}{_text_xml(t)}</w:r></w:p>' for t in texts)
+    body = doc.element.body
+    for p in list(parse_xml(f'<w:body {_WNS}>{paragraphs}</w:body>')):
+        body._insert_p(p)
+
+
+def add_run_paragraph(doc, text, fmt):
+    """Append a paragraph holding a single run of *text* formatted as *fmt*."""
+    doc.element.body._insert_p(
+        parse_xml(f'<w:p {_WNS}><w:r>{_rpr_xml(fmt)}{_text_xml(text)}</w:r></w:p>')
+    )
 
 
 def add_body(doc, text, bold=False):
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.size = Pt(10)
-    run.font.color.rgb = BODY_TEXT_RGB
-    run.bold = bold
-    p.paragraph_format.space_after = Pt(6)
-    return p
+    add_body_batch(doc, (text,), bold)
+
+
+def _docx_bytes(doc):
+    """Serialize *doc* as the template package with only its body swapped in.
+
+    The reports only ever edit ``word/document.xml``, so every other member is
+    copied from the template as-is rather than re-serialized by python-docx's
+    packaging layer. Members are deflated at level 1: most of the archive is
+    the ~800KB of bundled style XML, and level 1 compresses it in about a
+    third less time than zlib's default at the cost of a larger file.
+    """
+    document_xml = doc.part.blob
+    # Assemble the archive in memory so the caller writes the file with one
+    # call instead of a small write per zip member.
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for name, data in _BASE_MEMBERS:
+            zf.writestr(name, document_xml if name == 'word/document.xml' else data)
+    return buf.getvalue()
 
 
 # ============================================================
 # 1. WORKERS' COMPENSATION — MULTI-STATE RETROSPECTIVE POLICY
 #    (PDF — 6 pages, very dense)
 # ============================================================
-def generate_workers_comp_retro():
-    path = os.path.join(OUT_DIR, 'Workers_Comp_Retro_Rating_Atlas_Industries.pdf')
-    doc = SimpleDocTemplate(path, pagesize=letter,
-                            topMargin=0.6 * inch, bottomMargin=0.7 * inch,
-                            leftMargin=0.75 * inch, rightMargin=0.75 * inch)
+def generate_workers_comp_retro(out_dir=_OUT):
+    path = out_dir / 'Workers_Comp_Retro_Rating_Atlas_Industries.pdf'
     story = []
 
     story.append(header_table([
@@ -417,15 +643,7 @@ def generate_workers_comp_retro():
             [ll[5], ll[6], ll[7]],
         ]
         ft = Table(fin_data, colWidths=[2.1 * inch, 2.2 * inch, 2.2 * inch])
-        ft.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BACKGROUND', (0, 0), (-1, 0), LIGHT_BLUE),
-            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_GRAY),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('TOPPADDING', (0, 0), (-1, -1), 5),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-        ]))
+        ft.setStyle(_FIN_TABLE_STYLE)
         story.append(ft)
         story.append(Spacer(1, 8))
 
@@ -474,214 +692,237 @@ def generate_workers_comp_retro():
                            'accordance with the NCCI retrospective rating manual and applicable state rating bureau rules.',
                            styles['SmallGray']))
 
-    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    build_pdf(path, story)
     print(f"  Created: {path}")
 
 
 # ============================================================
 # 2. EXCESS LIABILITY (UMBRELLA) — MULTI-LAYER TOWER
-#    (PDF — 5 pages)
+#    (PDF — 4 pages)
 # ============================================================
-def generate_excess_umbrella():
-    path = os.path.join(OUT_DIR, 'Excess_Umbrella_MultiLayer_TechCorp_Global.pdf')
-    doc = SimpleDocTemplate(path, pagesize=letter,
-                            topMargin=0.6 * inch, bottomMargin=0.7 * inch,
-                            leftMargin=0.75 * inch, rightMargin=0.75 * inch)
-    story = []
+_TOWER_HEADER = ('Layer', 'Carrier', 'Limit', 'Attachment\nPoint', 'Premium', 'Form', 'Defense')
+_TOWER_ROWS = (
+    ('Layer 4', 'Berkshire Hathaway', '$50,000,000', '$80M xs\nunderlying', '$142,000', 'Follow-Form\n(AIG Lead)', 'Within\nLimits'),
+    ('Layer 3', 'Swiss Re Corporate', '$25,000,000', '$55M xs\nunderlying', '$186,000', 'Follow-Form\n(AIG Lead)', 'Within\nLimits'),
+    ('Layer 2', 'Chubb Excess', '$25,000,000', '$30M xs\nunderlying', '$324,000', 'Follow-Form\n(AIG Lead)', 'Within\nLimits'),
+    ('Layer 1\n(AIG)', 'AIG Excess\nCasualty', '$25,000,000', '$5M xs\nunderlying', '$1,284,000', 'AIG-XS-2026\nLead Form', 'Outside\nLimits'),
+    ('Underlying', 'Various\n(see §III)', '$5,000,000', 'Primary\n(see §III)', '$2,487,000', 'Various\nPrimary', 'Per\nUnderlying'),
+)
 
-    story.append(header_table([
-        'Commercial Excess Liability (Umbrella)',
-        'Multi-Layer Tower  |  Policy No: AIG-XS-2026-GL-08842'
-    ]))
-    story.append(Spacer(1, 6))
-    story.append(HRFlowable(width="100%", thickness=2, color=AIG_BLUE))
-    story.append(Spacer(1, 14))
+_UNDERLYING_HEADER = ('Line', 'Carrier', 'Policy Number', 'Limit', 'Premium', 'Inception', 'Expiration')
+_UNDERLYING_ROWS = (
+    ('CGL', 'Hartford', 'HTF-GL-2026-44128', '$2M occ /\n$4M agg', '$486,000', '06/01/2026', '06/01/2027'),
+    ('Products/\nComp Ops', 'Hartford', 'HTF-GL-2026-44128', '$2M occ /\n$4M agg', 'Included\nin CGL', '06/01/2026', '06/01/2027'),
+    ('Commercial\nAuto', 'Travelers', 'TRV-CA-2026-88214', '$2M CSL', '$342,000', '06/01/2026', '06/01/2027'),
+    ('Employers\'\nLiability', 'AIG', 'AIG-WC-2026-44283', '$1M ea acc /\n$1M disease', '$624,000', '06/01/2026', '06/01/2027'),
+    ('D&O', 'Chubb', 'CHB-DO-2026-12847', '$5M per claim /\n$5M agg', '$428,000', '06/01/2026', '06/01/2027'),
+    ('E&O / Tech\nProfessional', 'Beazley', 'BZL-EO-2026-34821', '$5M per claim /\n$5M agg', '$384,000', '06/01/2026', '06/01/2027'),
+    ('Cyber\nLiability', 'AIG\nCyberEdge', 'AIG-CY-2026-22184', '$5M per event /\n$10M agg', '$223,000', '06/01/2026', '06/01/2027'),
+)
 
-    # ── Declarations ──
-    story.append(Paragraph('DECLARATIONS', styles['SectionHead']))
-    story.append(kv_table([
-        ['Named Insured:', 'TechCorp Global Holdings, Inc. and all subsidiaries\n'
-                          'as defined in the Scheduled Underlying Policies'],
-        ['DBA / Subsidiaries:', 'TechCorp Software Solutions, LLC\n'
-                               'TechCorp Cloud Infrastructure, Inc.\n'
-                               'TechCorp Autonomous Systems, LLC\n'
-                               'TechCorp Financial Services, Ltd. (UK)\n'
-                               'TechCorp Asia Pacific Pte. Ltd. (Singapore)'],
-        ['Mailing Address:', '2000 Innovation Drive, Suite 4000\nSan Jose, CA 95134'],
-        ['FEIN:', '94-7228341 (Parent)'],
-        ['Policy Period:', '06/01/2026 to 06/01/2027 — 12:01 AM Pacific Time'],
-        ['Policy Form:', 'AIG Excess Follow-Form w/ Drop-Down (AIG-XS-2026)'],
-        ['Retention:', 'Per underlying scheduled limits (see Section III)'],
-        ['Annual Premium:', '$1,284,000 (AIG layer only — see tower summary below)'],
-        ['Producer:', 'Aon Global Risk Solutions — Technology Practice\n'
-                     'Attn: Jennifer Walsh, Executive VP'],
-    ]))
-    story.append(Spacer(1, 10))
+_LOSS_HEADER = ('Year', 'Claim', 'Line', 'Description', 'Underlying\nPaid', 'Excess\nPaid', 'Excess\nReserve', 'Status')
+_LOSS_ROWS = (
+    ('2025', 'Patent\nInfringement', 'E&O', 'TechCorp Cloud v. Nexus Data — Patent '
+     'infringement re: distributed caching algorithm. Trial verdict: $8.2M. Appeal pending.',
+     '$5,000,000', '$1,800,000', '$1,400,000', 'OPEN\nAppeal'),
+    ('2024', 'Data\nBreach', 'Cyber', '2.1M customer records exfiltrated via zero-day '
+     'exploit. Notification costs, credit monitoring, regulatory fines (CCPA, GDPR). '
+     'Class action settled.', '$5,000,000', '$3,200,000', '$0', 'CLOSED'),
+    ('2023', 'Product\nLiability', 'CGL/\nProd', 'Autonomous drone collision at '
+     'construction site. Worker suffered TBI. Suit alleged defective obstacle detection. '
+     'Settled at mediation.', '$2,000,000', '$1,400,000', '$0', 'CLOSED'),
+    ('2023', 'Securities\nClass Action', 'D&O', 'Shareholder suit re: revenue recognition '
+     'restatement (FY2022 Q3-Q4). Dismissed on motion — defense costs only.',
+     '$2,800,000', '$0', '$0', 'CLOSED\n(Defense)'),
+)
 
-    # ── Tower ──
-    story.append(Paragraph('SECTION I — LIABILITY TOWER STRUCTURE', styles['SectionHead']))
-    story.append(Paragraph('The following table describes the complete liability tower for TechCorp Global. '
-                           'AIG provides Layer 1 ($25M xs $5M). Higher layers are placed with separate carriers '
-                           'as scheduled below. AIG has no obligations beyond the stated limit of Layer 1.',
-                           styles['BodyText2']))
-    story.append(Spacer(1, 6))
 
-    story.append(styled_table(
-        ['Layer', 'Carrier', 'Limit', 'Attachment\nPoint', 'Premium', 'Form', 'Defense'],
-        [
-            ['Layer 4', 'Berkshire Hathaway', '$50,000,000', '$80M xs\nunderlying', '$142,000', 'Follow-Form\n(AIG Lead)', 'Within\nLimits'],
-            ['Layer 3', 'Swiss Re Corporate', '$25,000,000', '$55M xs\nunderlying', '$186,000', 'Follow-Form\n(AIG Lead)', 'Within\nLimits'],
-            ['Layer 2', 'Chubb Excess', '$25,000,000', '$30M xs\nunderlying', '$324,000', 'Follow-Form\n(AIG Lead)', 'Within\nLimits'],
-            ['Layer 1\n(AIG)', 'AIG Excess\nCasualty', '$25,000,000', '$5M xs\nunderlying', '$1,284,000', 'AIG-XS-2026\nLead Form', 'Outside\nLimits'],
-            ['Underlying', 'Various\n(see §III)', '$5,000,000', 'Primary\n(see §III)', '$2,487,000', 'Various\nPrimary', 'Per\nUnderlying'],
-        ],
-        col_widths=[0.7 * inch, 1.0 * inch, 0.9 * inch, 0.8 * inch, 0.7 * inch, 0.9 * inch, 0.6 * inch]
+def generate_excess_umbrella(out_dir=_OUT):
+    path = out_dir / 'Excess_Umbrella_MultiLayer_TechCorp_Global.pdf'
+    story = []
+    story_extend = story.extend
+
+    story_extend((
+        header_table([
+            'Commercial Excess Liability (Umbrella)',
+            'Multi-Layer Tower  |  Policy No: AIG-XS-2026-GL-08842'
+        ]),
+        Spacer(1, 6),
+        HRFlowable(width="100%", thickness=2, color=AIG_BLUE),
+        Spacer(1, 14),
     ))
-    story.append(Spacer(1, 6))
-    story.append(Paragraph('<b>Total Tower Limit:</b> $130,000,000  |  '
-                           '<b>Total Program Premium:</b> $4,423,000  |  '
-                           '<b>AIG Share:</b> 29% of total tower premium',
-                           styles['BodyText2']))
 
-    story.append(PageBreak())
-
-    # ── Coverage ──
-    story.append(Paragraph('SECTION II — COVERAGE PROVISIONS', styles['SectionHead']))
-    story.append(Paragraph('<b>A. Insuring Agreement:</b> AIG will pay on behalf of the Insured those sums in '
-                           'excess of the Retained Limit that the Insured becomes legally obligated to pay as '
-                           'damages because of "bodily injury," "property damage," "personal and advertising injury," '
-                           'or "products-completed operations hazard" to which this insurance applies.',
-                           styles['BodyText2']))
-    story.append(Spacer(1, 6))
+    # ── Declarations ──
+    story_extend((
+        plain_paragraph('DECLARATIONS', 'SectionHead'),
+        kv_table([
+            ['Named Insured:', 'TechCorp Global Holdings, Inc. and all subsidiaries\n'
+                              'as defined in the Scheduled Underlying Policies'],
+            ['DBA / Subsidiaries:', 'TechCorp Software Solutions, LLC\n'
+                                   'TechCorp Cloud Infrastructure, Inc.\n'
+                                   'TechCorp Autonomous Systems, LLC\n'
+                                   'TechCorp Financial Services, Ltd. (UK)\n'
+                                   'TechCorp Asia Pacific Pte. Ltd. (Singapore)'],
+            ['Mailing Address:', '2000 Innovation Drive, Suite 4000\nSan Jose, CA 95134'],
+            ['FEIN:', '94-7228341 (Parent)'],
+            ['Policy Period:', '06/01/2026 to 06/01/2027 — 12:01 AM Pacific Time'],
+            ['Policy Form:', 'AIG Excess Follow-Form w/ Drop-Down (AIG-XS-2026)'],
+            ['Retention:', 'Per underlying scheduled limits (see Section III)'],
+            ['Annual Premium:', '$1,284,000 (AIG layer only — see tower summary below)'],
+            ['Producer:', 'Aon Global Risk Solutions — Technology Practice\n'
+                         'Attn: Jennifer Walsh, Executive VP'],
+        ]),
+        Spacer(1, 10),
+    ))
 
-    story.append(Paragraph('<b>B. Follow-Form Provisions:</b> Except as modified herein, this policy follows the '
-                           'terms, conditions, definitions, and exclusions of the Scheduled Underlying Insurance. '
-                           'Where the underlying policies contain conflicting terms, the most restrictive terms shall apply.',
-                           styles['BodyText2']))
-    story.append(Spacer(1, 6))
+    # ── Tower ──
+    story_extend((
+        plain_paragraph('SECTION I — LIABILITY TOWER STRUCTURE', 'SectionHead'),
+        plain_paragraph('The following table describes the complete liability tower for TechCorp Global. '
+                        'AIG provides Layer 1 ($25M xs $5M). Higher layers are placed with separate carriers '
+                        'as scheduled below. AIG has no obligations beyond the stated limit of Layer 1.'),
+        Spacer(1, 6),
+        styled_table(
+            _TOWER_HEADER, _TOWER_ROWS,
+            col_widths=[0.7 * inch, 1.0 * inch, 0.9 * inch, 0.8 * inch, 0.7 * inch, 0.9 * inch, 0.6 * inch]
+        ),
+        Spacer(1, 6),
+        Paragraph('<b>Total Tower Limit:</b> $130,000,000  |  '
+                  '<b>Total Program Premium:</b> $4,423,000  |  '
+                  '<b>AIG Share:</b> 29% of total tower premium',
+                  styles['BodyText2']),
+        CondPageBreak(4 * inch),
+    ))
 
-    story.append(Paragraph('<b>C. Drop-Down Provisions:</b>', styles['SubSection']))
+    # ── Coverage ──
+    story_extend((
+        plain_paragraph('SECTION II — COVERAGE PROVISIONS', 'SectionHead'),
+        Paragraph('<b>A. Insuring Agreement:</b> AIG will pay on behalf of the Insured those sums in '
+                  'excess of the Retained Limit that the Insured becomes legally obligated to pay as '
+                  'damages because of "bodily injury," "property damage," "personal and advertising injury," '
+                  'or "products-completed operations hazard" to which this insurance applies.',
+                  styles['BodyText2']),
+        Spacer(1, 6),
+        Paragraph('<b>B. Follow-Form Provisions:</b> Except as modified herein, this policy follows the '
+                  'terms, conditions, definitions, and exclusions of the Scheduled Underlying Insurance. '
+                  'Where the underlying policies contain conflicting terms, the most restrictive terms shall apply.',
+                  styles['BodyText2']),
+        Spacer(1, 6),
+        Paragraph('<b>C. Drop-Down Provisions:</b>', styles['SubSection']),
+    ))
     drops = [
-        '1. <b>Exhaustion of Underlying Aggregate:</b> If any underlying aggregate limit is exhausted by payment '
-        'of claims, this policy shall drop down and act as primary insurance for the remainder of the policy period, '
-        'subject to the self-insured retention (SIR) of $50,000 per occurrence.',
-
-        '2. <b>Underlying Insurer Insolvency:</b> If any underlying insurer becomes insolvent or is declared bankrupt, '
-        'this policy shall not drop down. The Insured shall be responsible for the full amount of the underlying limit '
-        'as if the underlying carrier had made payment.',
-
-        '3. <b>Non-Renewal of Underlying:</b> If any underlying policy is cancelled or non-renewed during the term '
-        'of this policy, the Insured must notify AIG within 30 days and secure replacement coverage acceptable to AIG '
-        'within 60 days. Failure to do so will result in suspension of drop-down coverage.',
-
-        '4. <b>Defense Costs:</b> Defense costs under Layer 1 (AIG) are payable OUTSIDE the limits of liability. '
-        'AIG has the right and duty to defend any claim or suit seeking damages covered under this policy, even if '
-        'the allegations are groundless, false, or fraudulent. Defense obligation ceases upon exhaustion of the '
-        'applicable limit of liability.',
-
-        '5. <b>Punitive/Exemplary Damages:</b> This policy provides coverage for punitive or exemplary damages '
-        'where insurable by law in the jurisdiction where such damages are awarded. This coverage applies to the '
-        'following jurisdictions only: CA, FL, GA, IL, NJ, NY, TX. All other jurisdictions: EXCLUDED.',
+        ('Exhaustion of Underlying Aggregate:',
+         'If any underlying aggregate limit is exhausted by payment '
+         'of claims, this policy shall drop down and act as primary insurance for the remainder of the policy period, '
+         'subject to the self-insured retention (SIR) of $50,000 per occurrence.'),
+
+        ('Underlying Insurer Insolvency:',
+         'If any underlying insurer becomes insolvent or is declared bankrupt, '
+         'this policy shall not drop down. The Insured shall be responsible for the full amount of the underlying limit '
+         'as if the underlying carrier had made payment.'),
+
+        ('Non-Renewal of Underlying:',
+         'If any underlying policy is cancelled or non-renewed during the term '
+         'of this policy, the Insured must notify AIG within 30 days and secure replacement coverage acceptable to AIG '
+         'within 60 days. Failure to do so will result in suspension of drop-down coverage.'),
+
+        ('Defense Costs:',
+         'Defense costs under Layer 1 (AIG) are payable OUTSIDE the limits of liability. '
+         'AIG has the right and duty to defend any claim or suit seeking damages covered under this policy, even if '
+         'the allegations are groundless, false, or fraudulent. Defense obligation ceases upon exhaustion of the '
+         'applicable limit of liability.'),
+
+        ('Punitive/Exemplary Damages:',
+         'This policy provides coverage for punitive or exemplary damages '
+         'where insurable by law in the jurisdiction where such damages are awarded. This coverage applies to the '
+         'following jurisdictions only: CA, FL, GA, IL, NJ, NY, TX. All other jurisdictions: EXCLUDED.'),
     ]
-    for d in drops:
-        story.append(Paragraph(d, styles['BodyText2']))
-        story.append(Spacer(1, 3))
+    for i, (label, text) in enumerate(drops, 1):
+        story_extend((
+            label_paragraph(label, text, prefix=f'{i}. '),
+            Spacer(1, 3),
+        ))
 
-    story.append(PageBreak())
+    story.append(CondPageBreak(4 * inch))
 
     # ── Underlying Schedule ──
-    story.append(Paragraph('SECTION III — SCHEDULE OF UNDERLYING INSURANCE', styles['SectionHead']))
-    story.append(Paragraph('The following policies must be maintained in force for the duration of this excess policy. '
-                           'Any material change, cancellation, or non-renewal must be reported to AIG within 30 days.',
-                           styles['BodyText2']))
-    story.append(Spacer(1, 6))
-
-    story.append(styled_table(
-        ['Line', 'Carrier', 'Policy Number', 'Limit', 'Premium', 'Inception', 'Expiration'],
-        [
-            ['CGL', 'Hartford', 'HTF-GL-2026-44128', '$2M occ /\n$4M agg', '$486,000', '06/01/2026', '06/01/2027'],
-            ['Products/\nComp Ops', 'Hartford', 'HTF-GL-2026-44128', '$2M occ /\n$4M agg', 'Included\nin CGL', '06/01/2026', '06/01/2027'],
-            ['Commercial\nAuto', 'Travelers', 'TRV-CA-2026-88214', '$2M CSL', '$342,000', '06/01/2026', '06/01/2027'],
-            ['Employers\'\nLiability', 'AIG', 'AIG-WC-2026-44283', '$1M ea acc /\n$1M disease', '$624,000', '06/01/2026', '06/01/2027'],
-            ['D&O', 'Chubb', 'CHB-DO-2026-12847', '$5M per claim /\n$5M agg', '$428,000', '06/01/2026', '06/01/2027'],
-            ['E&O / Tech\nProfessional', 'Beazley', 'BZL-EO-2026-34821', '$5M per claim /\n$5M agg', '$384,000', '06/01/2026', '06/01/2027'],
-            ['Cyber\nLiability', 'AIG\nCyberEdge', 'AIG-CY-2026-22184', '$5M per event /\n$10M agg', '$223,000', '06/01/2026', '06/01/2027'],
-        ],
-        col_widths=[0.7 * inch, 0.7 * inch, 1.2 * inch, 0.9 * inch, 0.7 * inch, 0.7 * inch, 0.7 * inch]
+    story_extend((
+        plain_paragraph('SECTION III — SCHEDULE OF UNDERLYING INSURANCE', 'SectionHead'),
+        plain_paragraph('The following policies must be maintained in force for the duration of this excess policy. '
+                        'Any material change, cancellation, or non-renewal must be reported to AIG within 30 days.'),
+        Spacer(1, 6),
+        styled_table(
+            _UNDERLYING_HEADER, _UNDERLYING_ROWS,
+            col_widths=[0.7 * inch, 0.7 * inch, 1.2 * inch, 0.9 * inch, 0.7 * inch, 0.7 * inch, 0.7 * inch]
+        ),
+        Spacer(1, 6),
+        Paragraph('<b>Total Underlying Premium:</b> $2,487,000  |  '
+                  '<b>Note:</b> The CGL and Products/Completed Operations share a common aggregate.',
+                  styles['BodyText2']),
+        Spacer(1, 10),
     ))
-    story.append(Spacer(1, 6))
-    story.append(Paragraph('<b>Total Underlying Premium:</b> $2,487,000  |  '
-                           '<b>Note:</b> The CGL and Products/Completed Operations share a common aggregate.',
-                           styles['BodyText2']))
-    story.append(Spacer(1, 10))
 
     # ── Exclusions ──
-    story.append(Paragraph('SECTION IV — SPECIFIC EXCLUSIONS (Beyond Underlying)', styles['SectionHead']))
+    story.append(plain_paragraph('SECTION IV — SPECIFIC EXCLUSIONS (Beyond Underlying)', 'SectionHead'))
     exclusions = [
-        '<b>1. AI / Autonomous Systems Exclusion:</b> This policy does not cover claims arising from or related to '
-        'the operation, deployment, or failure of autonomous systems, machine learning models, or artificial intelligence '
-        'applications developed, sold, or licensed by TechCorp Autonomous Systems, LLC, EXCEPT to the extent such claims '
-        'are covered under the scheduled E&O/Technology Professional Liability policy (Beazley BZL-EO-2026-34821) and '
-        'exhaust the underlying limit. This exception does not apply to autonomous vehicle or drone operations.',
-
-        '<b>2. War / Terrorism / Cyber War:</b> This policy excludes all claims arising from: (a) war, invasion, '
-        'hostilities, or warlike operations; (b) terrorism as defined under TRIA; (c) cyber warfare, state-sponsored '
-        'cyber attacks, or attacks on critical infrastructure. Note: Standard cyber incidents are covered under the '
-        'scheduled CyberEdge policy.',
-
-        '<b>3. PFAS / Forever Chemicals:</b> Bodily injury or property damage arising from or related to the '
-        'manufacture, distribution, sale, or use of per- and polyfluoroalkyl substances (PFAS) is EXCLUDED from '
-        'this policy in its entirety. No coverage is provided regardless of the underlying policy terms.',
-
-        '<b>4. Cannabis / THC Operations:</b> No coverage for claims arising from the cultivation, manufacture, '
-        'distribution, sale, or use of cannabis or cannabis-derived products.',
-
-        '<b>5. Sexual Abuse or Molestation:</b> This policy provides a $1,000,000 sublimit for sexual abuse or '
-        'molestation claims (occurrence and aggregate). Defense costs are within this sublimit.',
-
-        '<b>6. Employment Practices:</b> Employment practices claims (discrimination, harassment, wrongful termination, '
-        'retaliation) are excluded unless covered under a scheduled underlying EPLI policy. TechCorp currently has no '
-        'underlying EPLI — this gap is noted in the underwriting file.',
+        ('1. AI / Autonomous Systems Exclusion:',
+         'This policy does not cover claims arising from or related to '
+         'the operation, deployment, or failure of autonomous systems, machine learning models, or artificial intelligence '
+         'applications developed, sold, or licensed by TechCorp Autonomous Systems, LLC, EXCEPT to the extent such claims '
+         'are covered under the scheduled E&O/Technology Professional Liability policy (Beazley BZL-EO-2026-34821) and '
+         'exhaust the underlying limit. This exception does not apply to autonomous vehicle or drone operations.'),
+
+        ('2. War / Terrorism / Cyber War:',
+         'This policy excludes all claims arising from: (a) war, invasion, '
+         'hostilities, or warlike operations; (b) terrorism as defined under TRIA; (c) cyber warfare, state-sponsored '
+         'cyber attacks, or attacks on critical infrastructure. Note: Standard cyber incidents are covered under the '
+         'scheduled CyberEdge policy.'),
+
+        ('3. PFAS / Forever Chemicals:',
+         'Bodily injury or property damage arising from or related to the '
+         'manufacture, distribution, sale, or use of per- and polyfluoroalkyl substances (PFAS) is EXCLUDED from '
+         'this policy in its entirety. No coverage is provided regardless of the underlying policy terms.'),
+
+        ('4. Cannabis / THC Operations:',
+         'No coverage for claims arising from the cultivation, manufacture, '
+         'distribution, sale, or use of cannabis or cannabis-derived products.'),
+
+        ('5. Sexual Abuse or Molestation:',
+         'This policy provides a $1,000,000 sublimit for sexual abuse or '
+         'molestation claims (occurrence and aggregate). Defense costs are within this sublimit.'),
+
+        ('6. Employment Practices:',
+         'Employment practices claims (discrimination, harassment, wrongful termination, '
+         'retaliation) are excluded unless covered under a scheduled underlying EPLI policy. TechCorp currently has no '
+         'underlying EPLI — this gap is noted in the underwriting file.'),
     ]
-    for ex in exclusions:
-        story.append(Paragraph(ex, styles['BodyText2']))
-        story.append(Spacer(1, 4))
+    for label, text in exclusions:
+        story_extend((
+            label_paragraph(label, text),
+            Spacer(1, 4),
+        ))
 
-    story.append(PageBreak())
+    story.append(CondPageBreak(4 * inch))
 
     # ── Loss History ──
-    story.append(Paragraph('SECTION V — EXCESS LOSS HISTORY', styles['SectionHead']))
-    story.append(Paragraph('Claims that have pierced or may pierce the underlying limits:', styles['BodyText2']))
-    story.append(Spacer(1, 6))
-
-    story.append(styled_table(
-        ['Year', 'Claim', 'Line', 'Description', 'Underlying\nPaid', 'Excess\nPaid', 'Excess\nReserve', 'Status'],
-        [
-            ['2025', 'Patent\nInfringement', 'E&O', 'TechCorp Cloud v. Nexus Data — Patent '
-             'infringement re: distributed caching algorithm. Trial verdict: $8.2M. Appeal pending.',
-             '$5,000,000', '$1,800,000', '$1,400,000', 'OPEN\nAppeal'],
-            ['2024', 'Data\nBreach', 'Cyber', '2.1M customer records exfiltrated via zero-day '
-             'exploit. Notification costs, credit monitoring, regulatory fines (CCPA, GDPR). '
-             'Class action settled.', '$5,000,000', '$3,200,000', '$0', 'CLOSED'],
-            ['2023', 'Product\nLiability', 'CGL/\nProd', 'Autonomous drone collision at '
-             'construction site. Worker suffered TBI. Suit alleged defective obstacle detection. '
-             'Settled at mediation.', '$2,000,000', '$1,400,000', '$0', 'CLOSED'],
-            ['2023', 'Securities\nClass Action', 'D&O', 'Shareholder suit re: revenue recognition '
-             'restatement (FY2022 Q3-Q4). Dismissed on motion — defense costs only.',
-             '$2,800,000', '$0', '$0', 'CLOSED\n(Defense)'],
-        ],
-        col_widths=[0.4 * inch, 0.6 * inch, 0.5 * inch, 2.0 * inch, 0.7 * inch, 0.6 * inch, 0.6 * inch, 0.6 * inch]
+    story_extend((
+        plain_paragraph('SECTION V — EXCESS LOSS HISTORY', 'SectionHead'),
+        plain_paragraph('Claims that have pierced or may pierce the underlying limits:'),
+        Spacer(1, 6),
+        styled_table(
+            _LOSS_HEADER, _LOSS_ROWS,
+            col_widths=[0.4 * inch, 0.6 * inch, 0.5 * inch, 2.0 * inch, 0.7 * inch, 0.6 * inch, 0.6 * inch, 0.6 * inch]
+        ),
+        Spacer(1, 8),
+        Paragraph('<b>3-Year Excess Losses:</b> $7,800,000  |  <b>Outstanding Reserves:</b> $1,400,000  |  '
+                  '<b>Total Excess Incurred:</b> $9,200,000',
+                  styles['BodyText2']),
+        Paragraph('<b>3-Year Layer 1 Loss Ratio:</b> 238% ($9.2M incurred vs. $3.85M premium over 3 years). '
+                  'Renewal premium increase of 42% reflects this adverse experience.',
+                  styles['BodyText2']),
+        Spacer(1, 14),
+        plain_paragraph('SECTION VI — SPECIAL UNDERWRITING CONDITIONS', 'SectionHead'),
     ))
-    story.append(Spacer(1, 8))
-    story.append(Paragraph('<b>3-Year Excess Losses:</b> $7,800,000  |  <b>Outstanding Reserves:</b> $1,400,000  |  '
-                           '<b>Total Excess Incurred:</b> $9,200,000',
-                           styles['BodyText2']))
-    story.append(Paragraph('<b>3-Year Layer 1 Loss Ratio:</b> 238% ($9.2M incurred vs. $3.85M premium over 3 years). '
-                           'Renewal premium increase of 42% reflects this adverse experience.',
-                           styles['BodyText2']))
-
-    story.append(Spacer(1, 14))
-    story.append(Paragraph('SECTION VI — SPECIAL UNDERWRITING CONDITIONS', styles['SectionHead']))
     conditions = [
         '<b>1. EPLI Gap:</b> TechCorp must procure Employment Practices Liability Insurance with a minimum limit '
         'of $5,000,000 by 09/01/2026. Failure to do so will result in a $250,000 sublimit for employment-related '
@@ -696,15 +937,19 @@ def generate_excess_umbrella():
         'scheduled underlying policies which include DIC/DIL provisions for local admitted requirements.',
     ]
     for c in conditions:
-        story.append(Paragraph(c, styles['BodyText2']))
-        story.append(Spacer(1, 4))
-
-    story.append(Spacer(1, 14))
-    story.append(HRFlowable(width="100%", thickness=1, color=BORDER_GRAY))
-    story.append(Spacer(1, 6))
-    story.append(Paragraph('End of Policy Declaration — AIG Excess Casualty Division.', styles['SmallGray']))
+        story_extend((
+            Paragraph(c, styles['BodyText2']),
+            Spacer(1, 4),
+        ))
+
+    story_extend((
+        Spacer(1, 14),
+        HRFlowable(width="100%", thickness=1, color=BORDER_GRAY),
+        Spacer(1, 6),
+        plain_paragraph('End of Policy Declaration — AIG Excess Casualty Division.', 'SmallGray'),
+    ))
 
-    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    build_pdf(path, story)
     print(f"  Created: {path}")
 
 
@@ -712,326 +957,303 @@ def generate_excess_umbrella():
 # 3. CATASTROPHE LOSS REPORT — HURRICANE DAMAGE ASSESSMENT
 #    (DOCX — detailed multi-section report)
 # ============================================================
-def generate_cat_loss_report():
-    path = os.path.join(OUT_DIR, 'CAT_Loss_Report_Hurricane_Damage_CrescentBay.docx')
-    doc = Document()
-
-    title = doc.add_heading('Catastrophe Loss Report', level=0)
-    for run in title.runs:
-        run.font.color.rgb = AIG_BLUE_RGB
-
-    subtitle = doc.add_paragraph()
-    run = subtitle.add_run(
-        'Hurricane Helene — Category 3 Landfall\n'
-        'CAT Event Reference: AIG-CAT-2025-HELENE-09\n'
-        'Insured: Crescent Bay Resort & Marina, LLC\n'
-        'Date of Loss: September 12-14, 2025\n'
-        'Report Date: February 1, 2026  |  Valuation: January 15, 2026'
-    )
-    run.font.size = Pt(10)
-    run.font.color.rgb = MUTED_RGB
+_SUBTITLE = (
+    'Hurricane Helene — Category 3 Landfall\n'
+    'CAT Event Reference: AIG-CAT-2025-HELENE-09\n'
+    'Insured: Crescent Bay Resort & Marina, LLC\n'
+    'Date of Loss: September 12-14, 2025\n'
+    'Report Date: February 1, 2026  |  Valuation: January 15, 2026'
+)
+
+_EXEC_SUMMARY = (
+    'Hurricane Helene made landfall as a Category 3 storm near Cedar Key, Florida on September 12, '
+    '2025, with maximum sustained winds of 120 mph and a storm surge of 9-12 feet above normal tide levels '
+    'along the Gulf Coast of Florida. The insured property, Crescent Bay Resort & Marina, sustained severe '
+    'wind damage, storm surge flooding, and marina infrastructure destruction.'
+)
+
+_LIMITS_ADEQUACY = (
+    'POLICY LIMITS ADEQUACY: Estimated loss exceeds property limit. BI/EE approaching sublimit. '
+    'Excess carrier (Chubb) notified on 09/15/2025. Reinsurance notification filed under Treaty XL-2025-004.'
+)
+
+_CAUSATION_INTRO = (
+    'The causation of damage at Crescent Bay Resort requires careful allocation between wind (covered '
+    'under Named Storm provisions) and water/flood (subject to separate sublimit and deductible). Haag '
+    'Engineering conducted on-site inspection on 09/18-19/2025 and reviewed the following data sources:'
+)
+
+_FINDINGS_INTRO = (
+    'Based on high-water marks, debris field analysis, structural damage patterns, and the timeline '
+    'of storm conditions, Haag Engineering concludes the following causation allocation:'
+)
+
+_CAUSATION_NOTE = (
+    'NOTE: The anti-concurrent causation clause in the Named Storm endorsement provides that where '
+    'wind and water damage cannot be separated, the loss is subject to the higher deductible. However, '
+    'Haag Engineering\'s analysis provides a defensible allocation that AIG recommends adopting for '
+    'claim adjustment purposes, subject to insured agreement.'
+)
+
+_PREPARED_BY = (
+    'Report prepared by: Thomas Brennan, Senior Complex Claims Adjuster, AIG CAT Response Team. '
+    'This report is confidential and prepared for internal claim management purposes only. '
+    'All figures are preliminary estimates subject to final adjustment.'
+)
+
+_POLICY_DATA = (
+    ('Policy Number', 'AIG-CPP-2025-FL-71284'),
+    ('Named Insured', 'Crescent Bay Resort & Marina, LLC'),
+    ('Additional Insured', 'Crescent Bay Holdings, Inc. (Parent)\nFirst National Bank of Tampa (Mortgagee)'),
+    ('Property Address', '4800 Gulf Shore Drive, Crystal River, FL 34429'),
+    ('Building Limit', '$12,500,000 (Replacement Cost)'),
+    ('BPP / Contents Limit', '$4,200,000 (Replacement Cost)'),
+    ('Business Income + EE', '$3,500,000 (12-month ALS, 72-hr waiting period)'),
+    ('Named Storm Deductible', '5% of TIV at time of loss = $1,010,000 (based on $20,200,000 TIV)'),
+    ('Flood Sublimit', '$2,500,000 per occurrence (Zone VE — High Risk Coastal)'),
+    ('Flood Deductible', '$500,000'),
+    ('Marina/Pier Sublimit', '$1,500,000 (ACV basis)'),
+    ('Ordinance or Law', '$1,250,000 (Coverages A, B, C combined)'),
+    ('Debris Removal', '$500,000 (additional)'),
+    ('Policy Period', '07/01/2025 — 07/01/2026'),
+)
+
+_TIMELINE = (
+    ('09/09/2025 — 72 hrs prior', 'NHC issues Tropical Storm Watch for Citrus County. Insured activates '
+     'hurricane preparedness plan. Marina vessels begin evacuation. Portable generators staged.'),
+    ('09/10/2025 — 48 hrs prior', 'Tropical Storm Watch upgraded to Hurricane Warning. Helene intensifies to '
+     'Category 2. Insured deploys storm shutters, sandbags lobby and ground-floor rooms. Pool furniture secured. '
+     'Guests evacuated per county mandatory evacuation order (Zone A).'),
+    ('09/11/2025 — 24 hrs prior', 'Helene rapidly intensifies to Category 3. Storm surge forecast increased '
+     'from 6-8 ft to 9-12 ft. All staff except essential personnel evacuated. Emergency power systems tested. '
+     'Final property walkthrough conducted and documented with video.'),
+    ('09/12/2025 — Landfall', 'Hurricane Helene makes landfall at 2:14 AM EDT near Cedar Key (35 miles south '
+     'of insured property) with 120 mph sustained winds. Property experiences 105 mph sustained winds with '
+     '128 mph gusts. Storm surge reaches 10.4 ft above normal at property location per USGS gauge #02310947.'),
+    ('09/12/2025 — Post-Landfall', 'Storm surge begins receding by 8:00 AM. Significant structural damage '
+     'visible. Marina pier partially collapsed. 4 of 6 buildings show roof damage. Ground floor flooded to '
+     '4.2 ft depth. Emergency services inaccessible until 09/13.'),
+    ('09/13/2025 — First Assessment', 'Insured conducts initial damage assessment with property manager and '
+     'maintenance team. Photos and video documentation compiled. AIG notified via FNOL at 10:42 AM. '
+     'Claim number assigned: CLM-2025-FL-CAT-42871.'),
+    ('09/15/2025 — Adjuster Deployed', 'AIG CAT adjuster (Thomas Brennan, Senior Complex Claims) arrives on-site. '
+     'Independent structural engineer (Wiss, Janney, Elstner Associates) retained. Forensic meteorologist '
+     '(Haag Engineering) retained for wind vs. water causation analysis.'),
+)
+
+_B1_HEADER = ('Component', 'Peril', 'Estimated\nCost', 'Description')
+_B1_ROWS = (
+    ('Roof System', 'Wind', '$1,420,000', 'Approximately 35% of concrete tiles displaced or broken. '
+     'Underlayment exposed in 6 areas. Water intrusion into 22 guest rooms on 3rd floor. '
+     'Tile manufacturer (Eagle Roofing) confirmed tiles rated for 150 mph — failure at 128 mph '
+     'gusts suggests installation deficiency, not product failure. Roof warranty claim denied by installer.'),
+    ('Building Envelope', 'Wind', '$680,000', 'Impact damage to stucco facade on east and south elevations. '
+     '14 windows broken (non-impact rated — pre-dates FL Building Code 2020 requirement). '
+     'Balcony railings damaged on 8 units.'),
+    ('Interior — 3rd Floor', 'Wind/\nWater', '$1,240,000', 'Water damage to 22 guest rooms: flooring, drywall, '
+     'furniture, fixtures. Mold remediation required in 16 rooms (testing confirmed Aspergillus/Penicillium '
+     'above acceptable levels). Full gut renovation required.'),
+    ('Interior — 2nd Floor', 'Wind-\nDriven\nRain', '$420,000', 'Wind-driven rain penetration through window '
+     'breaches. 8 rooms affected — carpeting, lower drywall, bathroom fixtures.'),
+    ('Interior — 1st Floor', 'Storm\nSurge', '$1,860,000', 'Storm surge flooding to 4.2 ft depth. Complete '
+     'destruction of lobby, restaurant, spa, fitness center, and 12 ground-floor rooms. All flooring, '
+     'drywall to 4 ft, electrical outlets/switches, kitchen equipment, and HVAC air handlers destroyed. '
+     'NOTE: Subject to Flood Sublimit and separate deductible.'),
+    ('Elevator Systems', 'Flood', '$340,000', 'Both elevator pits flooded. Control panels, motors, and '
+     'guide rails require replacement. Otis Elevator inspection confirms total loss of elevator machinery. '
+     'Estimated replacement: 16-20 weeks lead time.'),
+    ('Electrical Systems', 'Surge/\nFlood', '$520,000', 'Main electrical panel (ground floor) destroyed by '
+     'surge water. Emergency generator operated for 72 hours post-storm but sustained salt water damage to '
+     'cooling system. Transfer switch damaged. Complete rewiring of ground floor required.'),
+)
+
+_B2_ITEMS = (
+    ('Metal Roof', 'Wind', '$480,000', 'Standing seam metal roof — 20% of panels peeled back by wind uplift. '
+     'Ridge cap separation along 120 linear feet. Underlayment intact in most areas.'),
+    ('Glass Curtain Wall', 'Wind/\nDebris', '$890,000', 'South-facing glass curtain wall suffered catastrophic '
+     'failure. 8 of 24 panels shattered by windborne debris (tree limbs from neighboring property). Interior '
+     'exposed to wind-driven rain for estimated 6 hours before tarping. AV equipment, stage, and ballroom '
+     'flooring destroyed.'),
+    ('Interior', 'Water', '$640,000', 'Water damage throughout from glass failure and roof leaks. Drop ceiling '
+     'collapsed. Carpet, lighting, and wall finishes require full replacement. Kitchen (catering) equipment '
+     'damaged by water intrusion.'),
+    ('HVAC', 'Wind', '$180,000', '3 rooftop HVAC units displaced from curbs. Ductwork damaged. Refrigerant '
+     'released (R-410A — EPA notification required).'),
+)
+
+_MARINA_ITEMS = (
+    ('Fixed Pier (300 ft)', 'Storm\nSurge', '$680,000', 'Concrete pier deck separated from pilings at 3 points. '
+     'Approximately 120 ft of pier is unusable. Pilings intact below waterline per dive inspection.'),
+    ('Floating Dock System', 'Surge/\nWind', '$420,000', 'Floating dock system (40 slips) — 60% destroyed. '
+     'Dock fingers broken, cleats pulled, gangways twisted. 12 slips salvageable with repair.'),
+    ('Fuel Dock & Pump Station', 'Surge', '$340,000', 'Underground fuel tanks intact (double-walled FRP). '
+     'Above-ground dispensers, piping, and electrical destroyed. DEP inspection required before reconstruction. '
+     'Fuel inventory loss: 2,400 gallons diesel, 1,800 gallons gasoline ($18,200).'),
+    ('Ship Store & Marina Office', 'Surge', '$180,000', 'Single-story CBS structure — flooded to 3.8 ft. '
+     'Contents total loss. Structure repairable.'),
+    ('Boat Lift (2 units)', 'Wind', '$120,000', '1 of 2 boat lifts twisted off rails. Motor housing damaged '
+     'on both units. Replacement parts: 12-16 week lead time from manufacturer.'),
+)
+
+_LS_HEADER = ('Category', 'Gross Loss', 'Deductible /\nSublimit', 'Net Payable')
+_LS_ROWS = (
+    ('Building 1 — Wind Damage', '$3,760,000', 'Named Storm\nDed: $1,010,000', '$2,750,000'),
+    ('Building 1 — Storm Surge (Flood)', '$2,720,000', 'Flood Sub:\n$2,500,000\nFlood Ded: $500,000', '$2,000,000'),
+    ('Building 2 — Wind Damage', '$1,550,000', 'Named Storm\nDed (applied\nabove)', '$1,550,000'),
+    ('Building 2 — Water Damage', '$640,000', '—', '$640,000'),
+    ('Marina & Pier', '$1,740,000', 'Sublimit:\n$1,500,000', '$1,500,000'),
+    ('Other Buildings (3-6)', '$1,420,000', '—', '$1,420,000'),
+    ('BPP / Contents (all bldgs)', '$2,180,000', '—', '$2,180,000'),
+    ('Debris Removal', '$482,000', 'Add\'l limit:\n$500,000', '$482,000'),
+    ('Business Income (5.5 months)', '$2,640,000', '72-hr wait\napplied', '$2,640,000'),
+    ('Extra Expense', '$860,000', 'Combined\nw/ BI sub:\n$3,500,000', '$860,000'),
+    ('Ordinance or Law', '$550,000', 'Sublimit:\n$1,250,000', '$550,000'),
+    ('Emergency Board-Up / Tarping', '$148,000', 'Sue & Labor', '$148,000'),
+    ('TOTAL', '$18,690,000', 'Various', '$16,720,000'),
+)
 
-    doc.add_paragraph()
+_GAPS = (
+    'Marina excess above sublimit: $240,000 — NOT COVERED (recommend sublimit increase at renewal)',
+    'Named Storm deductible impact: $1,010,000 — insured bears this cost',
+    'Flood deductible: $500,000 — insured bears this cost',
+    'Business Income approaching sublimit: $3,500,000 (current claim: $3,500,000) — if restoration exceeds '
+    '5.5 months, additional BI losses will be UNINSURED',
+    'Code upgrade costs (O&L): $550,000 estimated, well within $1,250,000 sublimit — ADEQUATELY COVERED',
+    'Total building damage ($12,970,000) approaches building limit ($12,500,000) — potential $470,000 shortfall '
+    'if additional damage discovered during reconstruction',
+)
+
+_SOURCES = (
+    'USGS storm surge gauge data (#02310947) — peak surge 10.4 ft NAVD88',
+    'NOAA buoy data (Station 42036) — peak sustained wind 105 mph, gusts 128 mph',
+    'Florida Automated Weather Network (FAWN) station at Lecanto — peak gust 118 mph',
+    'ASCE 7-22 wind speed analysis for Risk Category III structures',
+    'Insured\'s pre-storm video documentation (time-stamped 09/11/2025)',
+    'Satellite imagery (Maxar/Planet Labs) — pre-storm (09/10) and post-storm (09/13)',
+)
+
+_ALLOC_HEADER = ('Building / Component', 'Wind %', 'Water %')
+_ALLOC_ROWS = (
+    ('Building 1 — Roof & Upper Floors', '95%', '5%'),
+    ('Building 1 — Ground Floor', '15%', '85%'),
+    ('Building 2 — Conference Center', '80%', '20%'),
+    ('Marina & Pier', '25%', '75%'),
+    ('Other Buildings (above 1st floor)', '90%', '10%'),
+    ('Other Buildings (ground floor)', '20%', '80%'),
+    ('Site Improvements & Landscaping', '40%', '60%'),
+)
+
+_STEPS = (
+    '1. Complete structural engineering report (WJE) — expected by 02/28/2026',
+    '2. Finalize wind/water causation allocation with insured and mortgagee',
+    '3. Issue advance payment of $5,000,000 (undisputed wind damage) pending final adjustment',
+    '4. Engage replacement cost estimator for Building 1 renovation scope',
+    '5. Monitor Business Income claim — insured projects reopening 03/15/2026 (partial) and 06/01/2026 (full)',
+    '6. Coordinate with excess carrier (Chubb) if building damage exceeds primary limit',
+    '7. Review Ordinance or Law requirements with Citrus County Building Department',
+    '8. File subrogation potential against roof tile installer (warranty/installation deficiency)',
+    '9. DEP clearance required before marina fuel dock reconstruction',
+    '10. Reinsurance bordereaux update — Treaty XL-2025-004, AIG retention: $5,000,000',
+)
+
+
+def generate_cat_loss_report(out_dir=_OUT):
+    path = out_dir / 'CAT_Loss_Report_Hurricane_Damage_CrescentBay.docx'
+    doc = new_document()
+
+    add_heading_styled(doc, 'Catastrophe Loss Report', level=0)
+
+    add_run_paragraph(doc, _SUBTITLE, _MUTED_FMT)
+
+    add_spacer(doc)
 
     # ── Executive Summary ──
     add_heading_styled(doc, 'Executive Summary', level=2)
-    add_body(doc, 'Hurricane Helene made landfall as a Category 3 storm near Cedar Key, Florida on September 12, '
-             '2025, with maximum sustained winds of 120 mph and a storm surge of 9-12 feet above normal tide levels '
-             'along the Gulf Coast of Florida. The insured property, Crescent Bay Resort & Marina, sustained severe '
-             'wind damage, storm surge flooding, and marina infrastructure destruction.')
+    add_body(doc, _EXEC_SUMMARY)
     add_body(doc, 'TOTAL ESTIMATED LOSS: $18,742,000 (subject to adjustment)', bold=True)
-    add_body(doc, 'POLICY LIMITS ADEQUACY: Estimated loss exceeds property limit. BI/EE approaching sublimit. '
-             'Excess carrier (Chubb) notified on 09/15/2025. Reinsurance notification filed under Treaty XL-2025-004.', bold=True)
+    add_body(doc, _LIMITS_ADEQUACY, bold=True)
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
     # ── Policy Information ──
     add_heading_styled(doc, 'Policy Information', level=2)
-    policy_table = doc.add_table(rows=14, cols=2, style='Table Grid')
-    policy_data = [
-        ('Policy Number', 'AIG-CPP-2025-FL-71284'),
-        ('Named Insured', 'Crescent Bay Resort & Marina, LLC'),
-        ('Additional Insured', 'Crescent Bay Holdings, Inc. (Parent)\nFirst National Bank of Tampa (Mortgagee)'),
-        ('Property Address', '4800 Gulf Shore Drive, Crystal River, FL 34429'),
-        ('Building Limit', '$12,500,000 (Replacement Cost)'),
-        ('BPP / Contents Limit', '$4,200,000 (Replacement Cost)'),
-        ('Business Income + EE', '$3,500,000 (12-month ALS, 72-hr waiting period)'),
-        ('Named Storm Deductible', '5% of TIV at time of loss = $1,010,000 (based on $20,200,000 TIV)'),
-        ('Flood Sublimit', '$2,500,000 per occurrence (Zone VE — High Risk Coastal)'),
-        ('Flood Deductible', '$500,000'),
-        ('Marina/Pier Sublimit', '$1,500,000 (ACV basis)'),
-        ('Ordinance or Law', '$1,250,000 (Coverages A, B, C combined)'),
-        ('Debris Removal', '$500,000 (additional)'),
-        ('Policy Period', '07/01/2025 — 07/01/2026'),
-    ]
-    for i, (k, v) in enumerate(policy_data):
-        policy_table.cell(i, 0).text = k
-        policy_table.cell(i, 1).text = v
-        for p in policy_table.cell(i, 0).paragraphs:
-            for run in p.runs:
-                run.bold = True
-                run.font.size = Pt(9)
-        for p in policy_table.cell(i, 1).paragraphs:
-            for run in p.runs:
-                run.font.size = Pt(9)
-
-    doc.add_page_break()
+    doc.element.body._insert_tbl(build_table_xml(None, _POLICY_DATA, bold_first_col=True))
+
+    add_page_break(doc)
 
     # ── Storm Timeline ──
     add_heading_styled(doc, 'Storm Event Timeline', level=2)
-    timeline = [
-        ('09/09/2025 — 72 hrs prior', 'NHC issues Tropical Storm Watch for Citrus County. Insured activates '
-         'hurricane preparedness plan. Marina vessels begin evacuation. Portable generators staged.'),
-        ('09/10/2025 — 48 hrs prior', 'Tropical Storm Watch upgraded to Hurricane Warning. Helene intensifies to '
-         'Category 2. Insured deploys storm shutters, sandbags lobby and ground-floor rooms. Pool furniture secured. '
-         'Guests evacuated per county mandatory evacuation order (Zone A).'),
-        ('09/11/2025 — 24 hrs prior', 'Helene rapidly intensifies to Category 3. Storm surge forecast increased '
-         'from 6-8 ft to 9-12 ft. All staff except essential personnel evacuated. Emergency power systems tested. '
-         'Final property walkthrough conducted and documented with video.'),
-        ('09/12/2025 — Landfall', 'Hurricane Helene makes landfall at 2:14 AM EDT near Cedar Key (35 miles south '
-         'of insured property) with 120 mph sustained winds. Property experiences 105 mph sustained winds with '
-         '128 mph gusts. Storm surge reaches 10.4 ft above normal at property location per USGS gauge #02310947.'),
-        ('09/12/2025 — Post-Landfall', 'Storm surge begins receding by 8:00 AM. Significant structural damage '
-         'visible. Marina pier partially collapsed. 4 of 6 buildings show roof damage. Ground floor flooded to '
-         '4.2 ft depth. Emergency services inaccessible until 09/13.'),
-        ('09/13/2025 — First Assessment', 'Insured conducts initial damage assessment with property manager and '
-         'maintenance team. Photos and video documentation compiled. AIG notified via FNOL at 10:42 AM. '
-         'Claim number assigned: CLM-2025-FL-CAT-42871.'),
-        ('09/15/2025 — Adjuster Deployed', 'AIG CAT adjuster (Thomas Brennan, Senior Complex Claims) arrives on-site. '
-         'Independent structural engineer (Wiss, Janney, Elstner Associates) retained. Forensic meteorologist '
-         '(Haag Engineering) retained for wind vs. water causation analysis.'),
-    ]
-    for date, desc in timeline:
+    for date, desc in _TIMELINE:
         add_body(doc, date, bold=True)
         add_body(doc, desc)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ── Damage Assessment ──
     add_heading_styled(doc, 'Detailed Damage Assessment', level=2)
 
     add_heading_styled(doc, 'Building 1: Main Resort (3-story, 84 rooms)', level=3)
     add_body(doc, 'Construction: Reinforced concrete frame, stucco exterior, concrete tile roof (installed 2018).')
-    b1 = [
-        ('Roof System', 'Wind', '$1,420,000', 'Approximately 35% of concrete tiles displaced or broken. '
-         'Underlayment exposed in 6 areas. Water intrusion into 22 guest rooms on 3rd floor. '
-         'Tile manufacturer (Eagle Roofing) confirmed tiles rated for 150 mph — failure at 128 mph '
-         'gusts suggests installation deficiency, not product failure. Roof warranty claim denied by installer.'),
-        ('Building Envelope', 'Wind', '$680,000', 'Impact damage to stucco facade on east and south elevations. '
-         '14 windows broken (non-impact rated — pre-dates FL Building Code 2020 requirement). '
-         'Balcony railings damaged on 8 units.'),
-        ('Interior — 3rd Floor', 'Wind/\nWater', '$1,240,000', 'Water damage to 22 guest rooms: flooring, drywall, '
-         'furniture, fixtures. Mold remediation required in 16 rooms (testing confirmed Aspergillus/Penicillium '
-         'above acceptable levels). Full gut renovation required.'),
-        ('Interior — 2nd Floor', 'Wind-\nDriven\nRain', '$420,000', 'Wind-driven rain penetration through window '
-         'breaches. 8 rooms affected — carpeting, lower drywall, bathroom fixtures.'),
-        ('Interior — 1st Floor', 'Storm\nSurge', '$1,860,000', 'Storm surge flooding to 4.2 ft depth. Complete '
-         'destruction of lobby, restaurant, spa, fitness center, and 12 ground-floor rooms. All flooring, '
-         'drywall to 4 ft, electrical outlets/switches, kitchen equipment, and HVAC air handlers destroyed. '
-         'NOTE: Subject to Flood Sublimit and separate deductible.'),
-        ('Elevator Systems', 'Flood', '$340,000', 'Both elevator pits flooded. Control panels, motors, and '
-         'guide rails require replacement. Otis Elevator inspection confirms total loss of elevator machinery. '
-         'Estimated replacement: 16-20 weeks lead time.'),
-        ('Electrical Systems', 'Surge/\nFlood', '$520,000', 'Main electrical panel (ground floor) destroyed by '
-         'surge water. Emergency generator operated for 72 hours post-storm but sustained salt water damage to '
-         'cooling system. Transfer switch damaged. Complete rewiring of ground floor required.'),
-    ]
-
-    b1_table = doc.add_table(rows=len(b1) + 1, cols=4, style='Table Grid')
-    b1_headers = ['Component', 'Peril', 'Estimated\nCost', 'Description']
-    for j, h in enumerate(b1_headers):
-        b1_table.cell(0, j).text = h
-    style_header_row(b1_table.rows[0])
-    for i, (comp, peril, cost, desc) in enumerate(b1):
-        b1_table.cell(i + 1, 0).text = comp
-        b1_table.cell(i + 1, 1).text = peril
-        b1_table.cell(i + 1, 2).text = cost
-        b1_table.cell(i + 1, 3).text = desc
-        for j in range(4):
-            for p in b1_table.cell(i + 1, j).paragraphs:
-                for run in p.runs:
-                    run.font.size = Pt(8)
+    doc.element.body._insert_tbl(build_table_xml(_B1_HEADER, _B1_ROWS, font_half_pts=16))
 
     add_body(doc, 'Building 1 Subtotal: $6,480,000', bold=True)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     add_heading_styled(doc, 'Building 2: Conference Center & Ballroom', level=3)
     add_body(doc, 'Construction: Steel frame, glass curtain wall (south), metal roof. Built 2015.')
-    b2_items = [
-        ('Metal Roof', 'Wind', '$480,000', 'Standing seam metal roof — 20% of panels peeled back by wind uplift. '
-         'Ridge cap separation along 120 linear feet. Underlayment intact in most areas.'),
-        ('Glass Curtain Wall', 'Wind/\nDebris', '$890,000', 'South-facing glass curtain wall suffered catastrophic '
-         'failure. 8 of 24 panels shattered by windborne debris (tree limbs from neighboring property). Interior '
-         'exposed to wind-driven rain for estimated 6 hours before tarping. AV equipment, stage, and ballroom '
-         'flooring destroyed.'),
-        ('Interior', 'Water', '$640,000', 'Water damage throughout from glass failure and roof leaks. Drop ceiling '
-         'collapsed. Carpet, lighting, and wall finishes require full replacement. Kitchen (catering) equipment '
-         'damaged by water intrusion.'),
-        ('HVAC', 'Wind', '$180,000', '3 rooftop HVAC units displaced from curbs. Ductwork damaged. Refrigerant '
-         'released (R-410A — EPA notification required).'),
-    ]
-    for comp, peril, cost, desc in b2_items:
+    for comp, peril, cost, desc in _B2_ITEMS:
         add_body(doc, f'{comp} ({peril}): {cost}', bold=True)
         add_body(doc, desc)
     add_body(doc, 'Building 2 Subtotal: $2,190,000', bold=True)
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
     add_heading_styled(doc, 'Marina & Pier Infrastructure', level=3)
-    marina_items = [
-        ('Fixed Pier (300 ft)', 'Storm\nSurge', '$680,000', 'Concrete pier deck separated from pilings at 3 points. '
-         'Approximately 120 ft of pier is unusable. Pilings intact below waterline per dive inspection.'),
-        ('Floating Dock System', 'Surge/\nWind', '$420,000', 'Floating dock system (40 slips) — 60% destroyed. '
-         'Dock fingers broken, cleats pulled, gangways twisted. 12 slips salvageable with repair.'),
-        ('Fuel Dock & Pump Station', 'Surge', '$340,000', 'Underground fuel tanks intact (double-walled FRP). '
-         'Above-ground dispensers, piping, and electrical destroyed. DEP inspection required before reconstruction. '
-         'Fuel inventory loss: 2,400 gallons diesel, 1,800 gallons gasoline ($18,200).'),
-        ('Ship Store & Marina Office', 'Surge', '$180,000', 'Single-story CBS structure — flooded to 3.8 ft. '
-         'Contents total loss. Structure repairable.'),
-        ('Boat Lift (2 units)', 'Wind', '$120,000', '1 of 2 boat lifts twisted off rails. Motor housing damaged '
-         'on both units. Replacement parts: 12-16 week lead time from manufacturer.'),
-    ]
-    for comp, peril, cost, desc in marina_items:
+    for comp, peril, cost, desc in _MARINA_ITEMS:
         add_body(doc, f'{comp} ({peril}): {cost}', bold=True)
         add_body(doc, desc)
     add_body(doc, 'Marina Subtotal: $1,740,000 (subject to $1,500,000 sublimit — excess of $240,000 not covered)',
              bold=True)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ── Coverage Analysis ──
     add_heading_styled(doc, 'Coverage Application & Loss Summary', level=2)
 
-    loss_summary = doc.add_table(rows=14, cols=4, style='Table Grid')
-    ls_headers = ['Category', 'Gross Loss', 'Deductible /\nSublimit', 'Net Payable']
-    for j, h in enumerate(ls_headers):
-        loss_summary.cell(0, j).text = h
-    style_header_row(loss_summary.rows[0])
-
-    ls_data = [
-        ('Building 1 — Wind Damage', '$3,760,000', 'Named Storm\nDed: $1,010,000', '$2,750,000'),
-        ('Building 1 — Storm Surge (Flood)', '$2,720,000', 'Flood Sub:\n$2,500,000\nFlood Ded: $500,000', '$2,000,000'),
-        ('Building 2 — Wind Damage', '$1,550,000', 'Named Storm\nDed (applied\nabove)', '$1,550,000'),
-        ('Building 2 — Water Damage', '$640,000', '—', '$640,000'),
-        ('Marina & Pier', '$1,740,000', 'Sublimit:\n$1,500,000', '$1,500,000'),
-        ('Other Buildings (3-6)', '$1,420,000', '—', '$1,420,000'),
-        ('BPP / Contents (all bldgs)', '$2,180,000', '—', '$2,180,000'),
-        ('Debris Removal', '$482,000', 'Add\'l limit:\n$500,000', '$482,000'),
-        ('Business Income (5.5 months)', '$2,640,000', '72-hr wait\napplied', '$2,640,000'),
-        ('Extra Expense', '$860,000', 'Combined\nw/ BI sub:\n$3,500,000', '$860,000'),
-        ('Ordinance or Law', '$550,000', 'Sublimit:\n$1,250,000', '$550,000'),
-        ('Emergency Board-Up / Tarping', '$148,000', 'Sue & Labor', '$148,000'),
-        ('TOTAL', '$18,690,000', 'Various', '$16,720,000'),
-    ]
-    for i, (cat, gross, ded, net) in enumerate(ls_data):
-        loss_summary.cell(i + 1, 0).text = cat
-        loss_summary.cell(i + 1, 1).text = gross
-        loss_summary.cell(i + 1, 2).text = ded
-        loss_summary.cell(i + 1, 3).text = net
-        for j in range(4):
-            for p in loss_summary.cell(i + 1, j).paragraphs:
-                for run in p.runs:
-                    run.font.size = Pt(8.5)
-                    if i == len(ls_data) - 1:
-                        run.bold = True
-
-    doc.add_paragraph()
+    doc.element.body._insert_tbl(build_table_xml(_LS_HEADER, _LS_ROWS, font_half_pts=17,
+                                                 bold_last_row=True))
+
+    add_spacer(doc)
     add_body(doc, 'COVERAGE GAP ANALYSIS:', bold=True)
-    gaps = [
-        'Marina excess above sublimit: $240,000 — NOT COVERED (recommend sublimit increase at renewal)',
-        'Named Storm deductible impact: $1,010,000 — insured bears this cost',
-        'Flood deductible: $500,000 — insured bears this cost',
-        'Business Income approaching sublimit: $3,500,000 (current claim: $3,500,000) — if restoration exceeds '
-        '5.5 months, additional BI losses will be UNINSURED',
-        'Code upgrade costs (O&L): $550,000 estimated, well within $1,250,000 sublimit — ADEQUATELY COVERED',
-        'Total building damage ($12,970,000) approaches building limit ($12,500,000) — potential $470,000 shortfall '
-        'if additional damage discovered during reconstruction',
-    ]
-    for g in gaps:
-        add_body(doc, f'  - {g}')
+    add_body_batch(doc, [f'  - {g}' for g in _GAPS])
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ── Wind vs Water ──
     add_heading_styled(doc, 'Wind vs. Water Causation Analysis', level=2)
     add_body(doc, 'Prepared by: Haag Engineering Company — Forensic Meteorology Division')
-    add_body(doc, 'The causation of damage at Crescent Bay Resort requires careful allocation between wind (covered '
-             'under Named Storm provisions) and water/flood (subject to separate sublimit and deductible). Haag '
-             'Engineering conducted on-site inspection on 09/18-19/2025 and reviewed the following data sources:')
-    sources = [
-        'USGS storm surge gauge data (#02310947) — peak surge 10.4 ft NAVD88',
-        'NOAA buoy data (Station 42036) — peak sustained wind 105 mph, gusts 128 mph',
-        'Florida Automated Weather Network (FAWN) station at Lecanto — peak gust 118 mph',
-        'ASCE 7-22 wind speed analysis for Risk Category III structures',
-        'Insured\'s pre-storm video documentation (time-stamped 09/11/2025)',
-        'Satellite imagery (Maxar/Planet Labs) — pre-storm (09/10) and post-storm (09/13)',
-    ]
-    for s in sources:
-        add_body(doc, f'  {s}')
+    add_body(doc, _CAUSATION_INTRO)
+    add_body_batch(doc, [f'  {s}' for s in _SOURCES])
 
     add_body(doc, '\nFINDINGS:', bold=True)
-    add_body(doc, 'Based on high-water marks, debris field analysis, structural damage patterns, and the timeline '
-             'of storm conditions, Haag Engineering concludes the following causation allocation:')
-
-    alloc_table = doc.add_table(rows=8, cols=3, style='Table Grid')
-    alloc_headers = ['Building / Component', 'Wind %', 'Water %']
-    for j, h in enumerate(alloc_headers):
-        alloc_table.cell(0, j).text = h
-    style_header_row(alloc_table.rows[0])
-    alloc_data = [
-        ('Building 1 — Roof & Upper Floors', '95%', '5%'),
-        ('Building 1 — Ground Floor', '15%', '85%'),
-        ('Building 2 — Conference Center', '80%', '20%'),
-        ('Marina & Pier', '25%', '75%'),
-        ('Other Buildings (above 1st floor)', '90%', '10%'),
-        ('Other Buildings (ground floor)', '20%', '80%'),
-        ('Site Improvements & Landscaping', '40%', '60%'),
-    ]
-    for i, (comp, wind, water) in enumerate(alloc_data):
-        alloc_table.cell(i + 1, 0).text = comp
-        alloc_table.cell(i + 1, 1).text = wind
-        alloc_table.cell(i + 1, 2).text = water
-        for j in range(3):
-            for p in alloc_table.cell(i + 1, j).paragraphs:
-                for run in p.runs:
-                    run.font.size = Pt(9)
-
-    doc.add_paragraph()
-    add_body(doc, 'NOTE: The anti-concurrent causation clause in the Named Storm endorsement provides that where '
-             'wind and water damage cannot be separated, the loss is subject to the higher deductible. However, '
-             'Haag Engineering\'s analysis provides a defensible allocation that AIG recommends adopting for '
-             'claim adjustment purposes, subject to insured agreement.')
-
-    doc.add_paragraph()
+    add_body(doc, _FINDINGS_INTRO)
+
+    doc.element.body._insert_tbl(build_table_xml(_ALLOC_HEADER, _ALLOC_ROWS))
+
+    add_spacer(doc)
+    add_body(doc, _CAUSATION_NOTE)
+
+    add_spacer(doc)
 
     # ── Next Steps ──
     add_heading_styled(doc, 'Adjuster Recommendations & Next Steps', level=2)
-    steps = [
-        '1. Complete structural engineering report (WJE) — expected by 02/28/2026',
-        '2. Finalize wind/water causation allocation with insured and mortgagee',
-        '3. Issue advance payment of $5,000,000 (undisputed wind damage) pending final adjustment',
-        '4. Engage replacement cost estimator for Building 1 renovation scope',
-        '5. Monitor Business Income claim — insured projects reopening 03/15/2026 (partial) and 06/01/2026 (full)',
-        '6. Coordinate with excess carrier (Chubb) if building damage exceeds primary limit',
-        '7. Review Ordinance or Law requirements with Citrus County Building Department',
-        '8. File subrogation potential against roof tile installer (warranty/installation deficiency)',
-        '9. DEP clearance required before marina fuel dock reconstruction',
-        '10. Reinsurance bordereaux update — Treaty XL-2025-004, AIG retention: $5,000,000',
-    ]
-    for s in steps:
-        add_body(doc, s)
-
-    doc.add_paragraph()
-    p = doc.add_paragraph()
-    run = p.add_run('Report prepared by: Thomas Brennan, Senior Complex Claims Adjuster, AIG CAT Response Team. '
-                    'This report is confidential and prepared for internal claim management purposes only. '
-                    'All figures are preliminary estimates subject to final adjustment.')
-    run.font.size = Pt(8.5)
-    run.font.color.rgb = MUTED_RGB
-    run.italic = True
-
-    doc.save(path)
+    add_body_batch(doc, _STEPS)
+
+    add_spacer(doc)
+    add_run_paragraph(doc, _PREPARED_BY, _NOTE_FMT)
+
+    path.write_bytes(_docx_bytes(doc))
     print(f"  Created: {path}")
 
 
@@ -1039,404 +1261,367 @@ def generate_cat_loss_report():
 # 4. D&O + FIDUCIARY LIABILITY — COMPLEX CLAIMS-MADE POLICY
 #    (DOCX — dense policy with sublimits, retentions, exclusions)
 # ============================================================
-def generate_do_fiduciary():
-    path = os.path.join(OUT_DIR, 'DO_Fiduciary_Liability_Pinnacle_Healthcare.docx')
-    doc = Document()
-
-    title = doc.add_heading('Directors & Officers + Fiduciary Liability', level=0)
-    for run in title.runs:
-        run.font.color.rgb = AIG_BLUE_RGB
-
-    subtitle = doc.add_paragraph()
-    run = subtitle.add_run(
-        'Claims-Made and Reported Policy\n'
-        'Policy No: AIG-DO-2026-PH-55821  |  Fiduciary: AIG-FID-2026-PH-55822\n'
-        'Pinnacle Healthcare Systems, Inc.\n'
-        'Effective: 01/01/2026 — 01/01/2027'
-    )
-    run.font.size = Pt(10)
-    run.font.color.rgb = MUTED_RGB
+_DO_SUBTITLE = (
+    'Claims-Made and Reported Policy\n'
+    'Policy No: AIG-DO-2026-PH-55821  |  Fiduciary: AIG-FID-2026-PH-55822\n'
+    'Pinnacle Healthcare Systems, Inc.\n'
+    'Effective: 01/01/2026 — 01/01/2027'
+)
+
+_CLAIMS_MADE_NOTE = (
+    'This policy is issued on a Claims-Made and Reported basis. Only Claims first made against an '
+    'Insured during the Policy Period (or applicable Extended Reporting Period) AND reported to AIG '
+    'during the Policy Period (or within 60 days after expiration) are covered. The Retroactive Date '
+    'limits coverage to Wrongful Acts occurring on or after January 1, 2018. No coverage is provided '
+    'for any Wrongful Act occurring prior to this date.'
+)
+
+_DECL_DATA = (
+    ('Named Insured (Organization)', 'Pinnacle Healthcare Systems, Inc.'),
+    ('Subsidiaries', 'Pinnacle Medical Group, P.A.\n'
+                    'Pinnacle Surgery Centers, LLC (12 locations)\n'
+                    'Pinnacle Home Health Services, Inc.\n'
+                    'Pinnacle Health IT Solutions, LLC\n'
+                    'Pinnacle Physician Staffing, Inc.\n'
+                    'Pinnacle Healthcare Foundation (501(c)(3))'),
+    ('State of Incorporation', 'Delaware'),
+    ('Publicly Traded?', 'Yes — NYSE: PNHL (Market Cap: $4.2B as of 12/31/2025)'),
+    ('Annual Revenue', '$3.84 Billion (FY 2025)'),
+    ('Total Assets', '$6.12 Billion'),
+    ('Total Employees', '18,420 (including 2,840 physicians)'),
+    ('Board of Directors', '11 members (8 independent, 3 management)'),
+    ('D&O Limit of Liability', '$15,000,000 per claim and annual aggregate\n'
+                               '(Shared across Side A, B, and C)'),
+    ('Side A (Non-Indemnifiable)', '$15,000,000 — No retention'),
+    ('Side B (Corporate Reimbursement)', '$15,000,000 — $500,000 corporate retention per claim'),
+    ('Side C (Entity Securities)', '$15,000,000 — $1,000,000 corporate retention per claim\n'
+                                   'Sublimit: $7,500,000 for entity-only securities claims'),
+    ('Fiduciary Liability Limit', '$5,000,000 per claim and aggregate\n'
+                                  '$25,000 retention per claim'),
+    ('Retroactive Date', 'January 1, 2018 (D&O)  |  January 1, 2020 (Fiduciary)'),
+    ('Extended Reporting Period', 'Automatic: 60 days  |  Optional: 1-year ($100% premium)\n'
+                                  '3-year ($200% premium)'),
+    ('Annual Premium', 'D&O: $842,000  |  Fiduciary: $124,000  |  Total: $966,000'),
+)
+
+_DO_TOWER_HEADER = ('Layer', 'Carrier', 'Limit', 'Attachment', 'Premium')
+_DO_TOWER_ROWS = (
+    ('Layer 4', 'QBE', '$10,000,000', 'xs $40M', '$86,000'),
+    ('Layer 3', 'Zurich', '$15,000,000', 'xs $25M', '$148,000'),
+    ('Layer 2', 'Chubb', '$10,000,000', 'xs $15M', '$224,000'),
+    ('Layer 1 (AIG)', 'AIG', '$15,000,000', 'Primary', '$842,000'),
+)
+
+_INSURED_PERSONS = (
+    '(a) A director, officer, or equivalent executive of the Named Insured or any Subsidiary',
+    '(b) A trustee, administrator, or fiduciary of any Employee Benefit Plan',
+    '(c) A shadow director or de facto director as determined by applicable law',
+    '(d) An employee of the Named Insured ONLY with respect to Claims alleging wrongful '
+    'employment practices (EPLI extension — see Part V)',
+    '(e) The estate, heirs, or legal representatives of a deceased Insured Person',
+    '(f) The lawful spouse or domestic partner of an Insured Person ONLY to the extent '
+    'Claims seek damages from marital community property or jointly held assets',
+)
+
+_COVERAGE_SECTIONS = (
+    ('Side A — Non-Indemnifiable Loss',
+     'AIG shall pay Loss on behalf of any Insured Person arising from a Claim for a Wrongful Act, '
+     'but only to the extent such Loss is not indemnified by the Organization and is not indemnifiable '
+     'pursuant to applicable law, the Organization\'s charter, bylaws, or agreements.\n\n'
+     'Side A applies with NO retention. This is the broadest coverage and protects individual directors '
+     'and officers when the company cannot or will not indemnify them (e.g., insolvency, derivative suits, '
+     'or legal prohibition on indemnification).\n\n'
+     'Side A DIC (Difference in Conditions) Feature: If any underlying or co-primary D&O policy denies '
+     'coverage for a claim that would be covered under this policy\'s terms, Side A DIC drops down to '
+     'provide coverage, subject to the full policy limit.'),
+
+    ('Side B — Corporate Reimbursement',
+     'AIG shall pay Loss on behalf of the Organization arising from a Claim for a Wrongful Act committed '
+     'by an Insured Person, but only to the extent the Organization has indemnified or is required to '
+     'indemnify the Insured Person.\n\n'
+     'Retention: $500,000 per Claim applies to Side B only. The retention is satisfied by the Organization\'s '
+     'payment (not by AIG payment). If the Organization fails to advance the retention amount within 90 days '
+     'of demand by the Insured Person, Side A coverage shall apply as if the loss were non-indemnifiable.'),
+
+    ('Side C — Entity Securities Coverage',
+     'AIG shall pay Loss on behalf of the Organization arising from a Securities Claim brought by a '
+     'security holder of the Organization, whether individually, derivatively, or as part of a class, '
+     'alleging a violation of any federal, state, or foreign securities law or regulation.\n\n'
+     'Retention: $1,000,000 per Securities Claim.\n'
+     'Sublimit: $7,500,000 for entity-only Securities Claims (where no individual Insured Person is named).\n\n'
+     'IMPORTANT: Securities Claims arising from the following are subject to heightened scrutiny and may '
+     'require notice to AIG within 15 days (instead of standard 60 days):\n'
+     '- Restatement of financial statements\n'
+     '- SEC Wells Notice or formal investigation\n'
+     '- Whistleblower complaint under Dodd-Frank\n'
+     '- Shareholder demand letter alleging breach of fiduciary duty\n'
+     '- M&A transaction litigation (including appraisal actions)'),
+)
+
+_EXCLUSIONS = (
+    ('A. Prior & Pending Litigation', 'Any Claim based upon, arising from, or attributable to any '
+     'litigation, administrative proceeding, or investigation pending on or before the Retroactive Date, '
+     'or based upon the same or substantially the same facts alleged in such prior proceedings. '
+     'Pending matters as of the Retroactive Date are listed in Schedule A attached.'),
+
+    ('B. Fraud & Criminal Acts', 'Any deliberately fraudulent, dishonest, or criminal act committed by '
+     'an Insured Person, as established by a final, non-appealable adjudication, admission, or plea. '
+     'Defense costs are advanced until such determination is made. If fraud is established, AIG shall '
+     'be entitled to full reimbursement of all defense costs advanced (severability preserved — see Part VII).'),
+
+    ('C. Personal Profit / Illegal Remuneration', 'Any Claim based upon an Insured Person gaining '
+     'personal profit, remuneration, or advantage to which they were not legally entitled, including '
+     'but not limited to: insider trading, Section 16(b) short-swing profits, undisclosed self-dealing '
+     'transactions, or undisclosed related-party transactions.'),
+
+    ('D. Professional Medical Services', 'Any Claim arising from the rendering or failure to render '
+     'professional medical, surgical, dental, or pharmaceutical services. This exclusion does NOT apply '
+     'to: (1) Claims against directors or officers for failure to supervise the delivery of medical '
+     'services; (2) Claims alleging negligent credentialing or privileging decisions; or (3) Claims '
+     'alleging EMTALA violations at the board/management level.'),
+
+    ('E. ERISA / Employee Benefits', 'Any Claim under ERISA (Employee Retirement Income Security Act) '
+     'or similar state law relating to the administration of any Employee Benefit Plan, EXCEPT as '
+     'covered under the Fiduciary Liability section (Part VI) of this policy.'),
+
+    ('F. Antitrust / Price Fixing', 'Any Claim alleging violation of the Sherman Antitrust Act, '
+     'Clayton Act, Robinson-Patman Act, or any state antitrust or unfair competition statute, '
+     'EXCEPT defense costs only are covered until a final determination of liability. '
+     'Sublimit for antitrust defense: $2,500,000.'),
+
+    ('G. Pollution / Environmental', 'Any Claim for bodily injury, property damage, or remediation '
+     'costs arising from the actual, alleged, or threatened discharge, dispersal, release, or escape '
+     'of pollutants or contaminants. This exclusion does NOT apply to Securities Claims alleging '
+     'failure to disclose environmental liabilities in SEC filings.'),
+
+    ('H. Cyber / Privacy Event', 'Any Claim arising from a data breach, ransomware attack, or privacy '
+     'violation, EXCEPT to the extent such Claim is brought as a Securities Claim alleging failure to '
+     'maintain adequate cybersecurity controls or failure to disclose a material cyber incident. '
+     'Note: Dedicated Cyber Liability coverage should be maintained separately.'),
+
+    ('I. Medicare / Medicaid Fraud', 'Any Claim brought by or on behalf of the United States Government '
+     'alleging violation of the False Claims Act (31 USC §3729), Anti-Kickback Statute (42 USC §1320a-7b), '
+     'or Stark Law (42 USC §1395nn) relating to Medicare or Medicaid billing practices. '
+     'IMPORTANT: This exclusion applies to entity coverage (Side C) only. Individual directors and '
+     'officers retain coverage under Side A and B for defense of such claims.'),
+)
+
+_EPLI_DATA = (
+    ('EPLI Sublimit', '$5,000,000 per claim and aggregate (within D&O limit)'),
+    ('EPLI Retention', '$150,000 per claim (corporate)'),
+    ('Covered Wrongful Acts', 'Discrimination, harassment (including sexual harassment), wrongful '
+     'termination, retaliation, failure to promote, breach of employment contract, negligent '
+     'evaluation, defamation in employment context, invasion of employee privacy'),
+    ('Third-Party EPLI', 'Included — covers claims by patients, vendors, or visitors alleging '
+     'harassment or discrimination by employees'),
+    ('Wage & Hour Exclusion', 'EXCLUDED — No coverage for FLSA or state wage/hour claims. '
+     'Pinnacle had a $4.2M FLSA class action settlement in 2023 involving nurse overtime.'),
+    ('Workplace Violence', 'Included — $1,000,000 sublimit for workplace violence response costs '
+     '(counseling, security, relocation)'),
+    ('Regulatory Proceedings', 'EEOC, state human rights agencies, DOL investigations — '
+     'defense costs covered (no damages coverage for fines/penalties)'),
+    ('Predecessor Coverage', 'Includes claims arising from employment practices of acquired entities '
+     'provided acquisition closed after the Retroactive Date (01/01/2018)'),
+)
+
+_FID_PLANS = (
+    'Pinnacle Healthcare 401(k) Retirement Savings Plan — $482M assets (Fidelity)',
+    'Pinnacle Healthcare Defined Benefit Pension Plan — $218M assets (TIAA) — FROZEN effective 01/01/2022',
+    'Pinnacle Healthcare Group Health Plan — self-insured, 18,420 participants (Aetna ASO)',
+    'Pinnacle Healthcare Executive Deferred Compensation Plan — $34M (Rabbi Trust, Vanguard)',
+    'Pinnacle Healthcare ESOP — 2.4M shares ($48M at current market)',
+)
+
+_FID_RISKS = (
+    'The 401(k) plan was the subject of an excessive fee lawsuit (Garcia v. Pinnacle Healthcare, '
+    'S.D. Tex. 2024) that was dismissed on summary judgment. Plaintiffs have filed a notice of appeal '
+    'to the Fifth Circuit. If reversed, potential exposure is estimated at $8-12M in fee disgorgement. '
+    'This matter is SCHEDULED as a Known Circumstance and is subject to a $2,000,000 sublimit.',
+
+    'The frozen Defined Benefit Plan is currently 87% funded. PBGC premiums are current. The plan\'s '
+    'investment committee (3 members of the Board) oversees asset allocation. Recent shift from fixed '
+    'income to alternative investments (12% allocation to PE/hedge funds) may attract fiduciary scrutiny.',
+
+    'The ESOP underwent a Section 409(a) valuation in December 2025. The independent appraiser '
+    '(Stout Risius Ross) valued shares at $20.14 per share. Market price on valuation date was '
+    '$17.42. The premium of 15.6% over market is within acceptable range per DOL guidance but could '
+    'face challenge if stock price declines significantly.',
+)
+
+_CLAIMS_HEADER = ('Year', 'Claim Type', 'Description', 'Paid', 'Reserve', 'Status')
+_CLAIMS_ROWS = (
+    ('2025', 'Securities\nClass Action', 'Shareholder suit alleging misleading statements '
+     'about patient volume projections in Q2 2025 earnings call. Lead plaintiff: '
+     'Midwest Pension Trust.', '$0', '$4,200,000', 'OPEN\nDisc.'),
+    ('2024', 'EPLI', 'Former Chief Nursing Officer alleged wrongful termination '
+     'and gender discrimination. Settled at mediation.', '$680,000', '$0', 'CLOSED'),
+    ('2024', 'Derivative\nSuit', 'Shareholder derivative action alleging waste of '
+     'corporate assets related to failed EHR system implementation ($42M write-off). '
+     'Demand refused. Suit filed in Delaware Chancery.', '$1,240,000', '$0', 'CLOSED\n(Settled)'),
+    ('2023', 'FLSA\nClass Action', 'Nurse overtime class action — 3,200 class members. '
+     'NOT COVERED under D&O (wage/hour exclusion). Company paid from operating funds.',
+     'N/A\n(Excluded)', 'N/A', 'CLOSED\n$4.2M'),
+    ('2023', 'Fiduciary', '401(k) excessive fee suit (Garcia v. Pinnacle). Defense costs '
+     'covered under fiduciary policy. Dismissed on SJ — appeal pending.',
+     '$486,000\n(Defense)', '$200,000', 'OPEN\nAppeal'),
+    ('2022', 'Regulatory', 'DOJ/OIG investigation re: billing practices at 3 surgery '
+     'centers. No charges filed. Defense costs only.',
+     '$1,840,000\n(Defense)', '$0', 'CLOSED'),
+    ('2021', 'D&O\n(Side A)', 'Former CEO/founder sued individually by PE investor '
+     'alleging breach of representations in 2019 recapitalization. Non-indemnifiable '
+     'by company per Delaware law. Settled confidentially.',
+     '$2,400,000', '$0', 'CLOSED'),
+)
+
+_UW_CONDITIONS = (
+    '1. SECURITIES CLAIM REPORTING: Any Securities Claim must be reported within 15 days of service of '
+    'process on any Insured Person. Late reporting may result in coverage denial.',
+
+    '2. INDEPENDENT COUNSEL: AIG has the right to approve defense counsel selected by the Insured. '
+    'Pre-approved panel firms for securities matters: Sullivan & Cromwell, Skadden Arps, Gibson Dunn, '
+    'Latham & Watkins. Maximum hourly rates: Partners: $1,450, Associates: $875, Paralegals: $425.',
+
+    '3. ALLOCATION: Where a Claim involves both covered and uncovered matters, or both Insured Persons '
+    'and non-insured parties, AIG and the Insured shall use best efforts to agree on a fair and proper '
+    'allocation. If unable to agree, the matter shall be submitted to binding arbitration per AAA rules.',
+
+    '4. HAMMER CLAUSE (Modified): If AIG recommends settlement of a Claim and the Insured refuses, '
+    'AIG\'s liability shall not exceed: (a) the recommended settlement amount, plus (b) 70% of any '
+    'additional Loss incurred above the settlement amount, plus (c) defense costs incurred prior to '
+    'the settlement recommendation. The 30/70 split applies (70% AIG, 30% Insured).',
+
+    '5. CHANGE OF CONTROL: If during the Policy Period there is a Change of Control (acquisition of >50% '
+    'of voting securities, merger, or asset sale), coverage under this policy shall: (a) continue for '
+    'Wrongful Acts occurring prior to the Change of Control date; (b) terminate for Wrongful Acts '
+    'occurring after the Change of Control date; and (c) an automatic 6-year Discovery Period shall '
+    'apply at no additional premium for Side A only.',
+
+    '6. PENDING MATTERS — SCHEDULE A: The following matters are known to AIG and are excluded from '
+    'coverage (or subject to sublimits as noted): (a) Garcia v. Pinnacle — 401(k) fee suit (Fiduciary '
+    'sublimit: $2M); (b) Midwest Pension Trust v. Pinnacle — securities class action (currently covered, '
+    'reserves established); (c) TCEQ investigation of subsidiary medical waste disposal practices '
+    '(not yet a formal Claim — monitoring).',
+)
 
-    doc.add_paragraph()
+
+def generate_do_fiduciary(out_dir=_OUT):
+    path = out_dir / 'DO_Fiduciary_Liability_Pinnacle_Healthcare.docx'
+    doc = new_document()
+
+    add_heading_styled(doc, 'Directors & Officers + Fiduciary Liability', level=0)
+
+    add_run_paragraph(doc, _DO_SUBTITLE, _MUTED_FMT)
+
+    add_spacer(doc)
 
     # ── Declarations ──
     add_heading_styled(doc, 'Part I — Declarations', level=2)
-    decl_table = doc.add_table(rows=16, cols=2, style='Table Grid')
-    decl_data = [
-        ('Named Insured (Organization)', 'Pinnacle Healthcare Systems, Inc.'),
-        ('Subsidiaries', 'Pinnacle Medical Group, P.A.\n'
-                        'Pinnacle Surgery Centers, LLC (12 locations)\n'
-                        'Pinnacle Home Health Services, Inc.\n'
-                        'Pinnacle Health IT Solutions, LLC\n'
-                        'Pinnacle Physician Staffing, Inc.\n'
-                        'Pinnacle Healthcare Foundation (501(c)(3))'),
-        ('State of Incorporation', 'Delaware'),
-        ('Publicly Traded?', 'Yes — NYSE: PNHL (Market Cap: $4.2B as of 12/31/2025)'),
-        ('Annual Revenue', '$3.84 Billion (FY 2025)'),
-        ('Total Assets', '$6.12 Billion'),
-        ('Total Employees', '18,420 (including 2,840 physicians)'),
-        ('Board of Directors', '11 members (8 independent, 3 management)'),
-        ('D&O Limit of Liability', '$15,000,000 per claim and annual aggregate\n'
-                                   '(Shared across Side A, B, and C)'),
-        ('Side A (Non-Indemnifiable)', '$15,000,000 — No retention'),
-        ('Side B (Corporate Reimbursement)', '$15,000,000 — $500,000 corporate retention per claim'),
-        ('Side C (Entity Securities)', '$15,000,000 — $1,000,000 corporate retention per claim\n'
-                                       'Sublimit: $7,500,000 for entity-only securities claims'),
-        ('Fiduciary Liability Limit', '$5,000,000 per claim and aggregate\n'
-                                      '$25,000 retention per claim'),
-        ('Retroactive Date', 'January 1, 2018 (D&O)  |  January 1, 2020 (Fiduciary)'),
-        ('Extended Reporting Period', 'Automatic: 60 days  |  Optional: 1-year ($100% premium)\n'
-                                      '3-year ($200% premium)'),
-        ('Annual Premium', 'D&O: $842,000  |  Fiduciary: $124,000  |  Total: $966,000'),
-    ]
-    for i, (k, v) in enumerate(decl_data):
-        decl_table.cell(i, 0).text = k
-        decl_table.cell(i, 1).text = v
-        for p in decl_table.cell(i, 0).paragraphs:
-            for run in p.runs:
-                run.bold = True
-                run.font.size = Pt(9)
-        for p in decl_table.cell(i, 1).paragraphs:
-            for run in p.runs:
-                run.font.size = Pt(9)
-
-    doc.add_page_break()
+    doc.element.body._insert_tbl(build_table_xml(None, _DECL_DATA, bold_first_col=True))
+
+    add_page_break(doc)
 
     # ── D&O Tower ──
     add_heading_styled(doc, 'D&O Liability Tower', level=2)
     add_body(doc, 'The following tower provides $50,000,000 in total D&O limits. AIG is the primary carrier (Layer 1).')
 
-    tower = doc.add_table(rows=5, cols=5, style='Table Grid')
-    tower_headers = ['Layer', 'Carrier', 'Limit', 'Attachment', 'Premium']
-    for j, h in enumerate(tower_headers):
-        tower.cell(0, j).text = h
-    style_header_row(tower.rows[0])
-    tower_data = [
-        ('Layer 4', 'QBE', '$10,000,000', 'xs $40M', '$86,000'),
-        ('Layer 3', 'Zurich', '$15,000,000', 'xs $25M', '$148,000'),
-        ('Layer 2', 'Chubb', '$10,000,000', 'xs $15M', '$224,000'),
-        ('Layer 1 (AIG)', 'AIG', '$15,000,000', 'Primary', '$842,000'),
-    ]
-    for i, (layer, carrier, limit, attach, prem) in enumerate(tower_data):
-        tower.cell(i + 1, 0).text = layer
-        tower.cell(i + 1, 1).text = carrier
-        tower.cell(i + 1, 2).text = limit
-        tower.cell(i + 1, 3).text = attach
-        tower.cell(i + 1, 4).text = prem
-        for j in range(5):
-            for p in tower.cell(i + 1, j).paragraphs:
-                for run in p.runs:
-                    run.font.size = Pt(9)
+    doc.element.body._insert_tbl(build_table_xml(_DO_TOWER_HEADER, _DO_TOWER_ROWS))
 
     add_body(doc, 'Total D&O Tower: $50,000,000  |  Total Tower Premium: $1,300,000', bold=True)
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
     # ── Insured Persons ──
     add_heading_styled(doc, 'Part II — Insured Persons & Coverage', level=2)
     add_body(doc, '"Insured Person" means any natural person who was, is, or becomes during the Policy Period:')
-    persons = [
-        '(a) A director, officer, or equivalent executive of the Named Insured or any Subsidiary',
-        '(b) A trustee, administrator, or fiduciary of any Employee Benefit Plan',
-        '(c) A shadow director or de facto director as determined by applicable law',
-        '(d) An employee of the Named Insured ONLY with respect to Claims alleging wrongful '
-        'employment practices (EPLI extension — see Part V)',
-        '(e) The estate, heirs, or legal representatives of a deceased Insured Person',
-        '(f) The lawful spouse or domestic partner of an Insured Person ONLY to the extent '
-        'Claims seek damages from marital community property or jointly held assets',
-    ]
-    for p_text in persons:
-        add_body(doc, p_text)
+    add_body_batch(doc, _INSURED_PERSONS)
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
     # ── Coverage Sections ──
     add_heading_styled(doc, 'Part III — Coverage Sections (D&O)', level=2)
 
-    sections = [
-        ('Side A — Non-Indemnifiable Loss',
-         'AIG shall pay Loss on behalf of any Insured Person arising from a Claim for a Wrongful Act, '
-         'but only to the extent such Loss is not indemnified by the Organization and is not indemnifiable '
-         'pursuant to applicable law, the Organization\'s charter, bylaws, or agreements.\n\n'
-         'Side A applies with NO retention. This is the broadest coverage and protects individual directors '
-         'and officers when the company cannot or will not indemnify them (e.g., insolvency, derivative suits, '
-         'or legal prohibition on indemnification).\n\n'
-         'Side A DIC (Difference in Conditions) Feature: If any underlying or co-primary D&O policy denies '
-         'coverage for a claim that would be covered under this policy\'s terms, Side A DIC drops down to '
-         'provide coverage, subject to the full policy limit.'),
-
-        ('Side B — Corporate Reimbursement',
-         'AIG shall pay Loss on behalf of the Organization arising from a Claim for a Wrongful Act committed '
-         'by an Insured Person, but only to the extent the Organization has indemnified or is required to '
-         'indemnify the Insured Person.\n\n'
-         'Retention: $500,000 per Claim applies to Side B only. The retention is satisfied by the Organization\'s '
-         'payment (not by AIG payment). If the Organization fails to advance the retention amount within 90 days '
-         'of demand by the Insured Person, Side A coverage shall apply as if the loss were non-indemnifiable.'),
-
-        ('Side C — Entity Securities Coverage',
-         'AIG shall pay Loss on behalf of the Organization arising from a Securities Claim brought by a '
-         'security holder of the Organization, whether individually, derivatively, or as part of a class, '
-         'alleging a violation of any federal, state, or foreign securities law or regulation.\n\n'
-         'Retention: $1,000,000 per Securities Claim.\n'
-         'Sublimit: $7,500,000 for entity-only Securities Claims (where no individual Insured Person is named).\n\n'
-         'IMPORTANT: Securities Claims arising from the following are subject to heightened scrutiny and may '
-         'require notice to AIG within 15 days (instead of standard 60 days):\n'
-         '- Restatement of financial statements\n'
-         '- SEC Wells Notice or formal investigation\n'
-         '- Whistleblower complaint under Dodd-Frank\n'
-         '- Shareholder demand letter alleging breach of fiduciary duty\n'
-         '- M&A transaction litigation (including appraisal actions)'),
-    ]
-
-    for heading, body in sections:
+    for heading, body in _COVERAGE_SECTIONS:
         add_heading_styled(doc, heading, level=3)
         add_body(doc, body)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ── Exclusions ──
     add_heading_styled(doc, 'Part IV — Exclusions', level=2)
     add_body(doc, 'This policy shall not cover any Loss arising from or related to:')
 
-    exclusions = [
-        ('A. Prior & Pending Litigation', 'Any Claim based upon, arising from, or attributable to any '
-         'litigation, administrative proceeding, or investigation pending on or before the Retroactive Date, '
-         'or based upon the same or substantially the same facts alleged in such prior proceedings. '
-         'Pending matters as of the Retroactive Date are listed in Schedule A attached.'),
-
-        ('B. Fraud & Criminal Acts', 'Any deliberately fraudulent, dishonest, or criminal act committed by '
-         'an Insured Person, as established by a final, non-appealable adjudication, admission, or plea. '
-         'Defense costs are advanced until such determination is made. If fraud is established, AIG shall '
-         'be entitled to full reimbursement of all defense costs advanced (severability preserved — see Part VII).'),
-
-        ('C. Personal Profit / Illegal Remuneration', 'Any Claim based upon an Insured Person gaining '
-         'personal profit, remuneration, or advantage to which they were not legally entitled, including '
-         'but not limited to: insider trading, Section 16(b) short-swing profits, undisclosed self-dealing '
-         'transactions, or undisclosed related-party transactions.'),
-
-        ('D. Professional Medical Services', 'Any Claim arising from the rendering or failure to render '
-         'professional medical, surgical, dental, or pharmaceutical services. This exclusion does NOT apply '
-         'to: (1) Claims against directors or officers for failure to supervise the delivery of medical '
-         'services; (2) Claims alleging negligent credentialing or privileging decisions; or (3) Claims '
-         'alleging EMTALA violations at the board/management level.'),
-
-        ('E. ERISA / Employee Benefits', 'Any Claim under ERISA (Employee Retirement Income Security Act) '
-         'or similar state law relating to the administration of any Employee Benefit Plan, EXCEPT as '
-         'covered under the Fiduciary Liability section (Part VI) of this policy.'),
-
-        ('F. Antitrust / Price Fixing', 'Any Claim alleging violation of the Sherman Antitrust Act, '
-         'Clayton Act, Robinson-Patman Act, or any state antitrust or unfair competition statute, '
-         'EXCEPT defense costs only are covered until a final determination of liability. '
-         'Sublimit for antitrust defense: $2,500,000.'),
-
-        ('G. Pollution / Environmental', 'Any Claim for bodily injury, property damage, or remediation '
-         'costs arising from the actual, alleged, or threatened discharge, dispersal, release, or escape '
-         'of pollutants or contaminants. This exclusion does NOT apply to Securities Claims alleging '
-         'failure to disclose environmental liabilities in SEC filings.'),
-
-        ('H. Cyber / Privacy Event', 'Any Claim arising from a data breach, ransomware attack, or privacy '
-         'violation, EXCEPT to the extent such Claim is brought as a Securities Claim alleging failure to '
-         'maintain adequate cybersecurity controls or failure to disclose a material cyber incident. '
-         'Note: Dedicated Cyber Liability coverage should be maintained separately.'),
-
-        ('I. Medicare / Medicaid Fraud', 'Any Claim brought by or on behalf of the United States Government '
-         'alleging violation of the False Claims Act (31 USC §3729), Anti-Kickback Statute (42 USC §1320a-7b), '
-         'or Stark Law (42 USC §1395nn) relating to Medicare or Medicaid billing practices. '
-         'IMPORTANT: This exclusion applies to entity coverage (Side C) only. Individual directors and '
-         'officers retain coverage under Side A and B for defense of such claims.'),
-    ]
-
-    for heading, body in exclusions:
+    for heading, body in _EXCLUSIONS:
         add_heading_styled(doc, heading, level=3)
         add_body(doc, body)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ── EPLI Extension ──
     add_heading_styled(doc, 'Part V — Employment Practices Liability Extension', level=2)
     add_body(doc, 'This policy includes an Employment Practices Liability (EPLI) coverage extension for '
              'Pinnacle Healthcare Systems with the following terms:')
 
-    epli_table = doc.add_table(rows=8, cols=2, style='Table Grid')
-    epli_data = [
-        ('EPLI Sublimit', '$5,000,000 per claim and aggregate (within D&O limit)'),
-        ('EPLI Retention', '$150,000 per claim (corporate)'),
-        ('Covered Wrongful Acts', 'Discrimination, harassment (including sexual harassment), wrongful '
-         'termination, retaliation, failure to promote, breach of employment contract, negligent '
-         'evaluation, defamation in employment context, invasion of employee privacy'),
-        ('Third-Party EPLI', 'Included — covers claims by patients, vendors, or visitors alleging '
-         'harassment or discrimination by employees'),
-        ('Wage & Hour Exclusion', 'EXCLUDED — No coverage for FLSA or state wage/hour claims. '
-         'Pinnacle had a $4.2M FLSA class action settlement in 2023 involving nurse overtime.'),
-        ('Workplace Violence', 'Included — $1,000,000 sublimit for workplace violence response costs '
-         '(counseling, security, relocation)'),
-        ('Regulatory Proceedings', 'EEOC, state human rights agencies, DOL investigations — '
-         'defense costs covered (no damages coverage for fines/penalties)'),
-        ('Predecessor Coverage', 'Includes claims arising from employment practices of acquired entities '
-         'provided acquisition closed after the Retroactive Date (01/01/2018)'),
-    ]
-    for i, (k, v) in enumerate(epli_data):
-        epli_table.cell(i, 0).text = k
-        epli_table.cell(i, 1).text = v
-        for p in epli_table.cell(i, 0).paragraphs:
-            for run in p.runs:
-                run.bold = True
-                run.font.size = Pt(9)
-        for p in epli_table.cell(i, 1).paragraphs:
-            for run in p.runs:
-                run.font.size = Pt(9)
-
-    doc.add_paragraph()
+    doc.element.body._insert_tbl(build_table_xml(None, _EPLI_DATA, bold_first_col=True))
+
+    add_spacer(doc)
 
     # ── Fiduciary ──
     add_heading_styled(doc, 'Part VI — Fiduciary Liability Coverage', level=2)
     add_body(doc, 'This section provides separate coverage for claims alleging breach of fiduciary duty in '
              'connection with the administration of Employee Benefit Plans maintained by Pinnacle Healthcare.')
 
-    fid_plans = [
-        'Pinnacle Healthcare 401(k) Retirement Savings Plan — $482M assets (Fidelity)',
-        'Pinnacle Healthcare Defined Benefit Pension Plan — $218M assets (TIAA) — FROZEN effective 01/01/2022',
-        'Pinnacle Healthcare Group Health Plan — self-insured, 18,420 participants (Aetna ASO)',
-        'Pinnacle Healthcare Executive Deferred Compensation Plan — $34M (Rabbi Trust, Vanguard)',
-        'Pinnacle Healthcare ESOP — 2.4M shares ($48M at current market)',
-    ]
-    for plan in fid_plans:
-        add_body(doc, f'  {plan}')
+    add_body_batch(doc, [f'  {plan}' for plan in _FID_PLANS])
 
-    doc.add_paragraph()
+    add_spacer(doc)
     add_body(doc, 'FIDUCIARY RISK FACTORS:', bold=True)
-    risks = [
-        'The 401(k) plan was the subject of an excessive fee lawsuit (Garcia v. Pinnacle Healthcare, '
-        'S.D. Tex. 2024) that was dismissed on summary judgment. Plaintiffs have filed a notice of appeal '
-        'to the Fifth Circuit. If reversed, potential exposure is estimated at $8-12M in fee disgorgement. '
-        'This matter is SCHEDULED as a Known Circumstance and is subject to a $2,000,000 sublimit.',
-
-        'The frozen Defined Benefit Plan is currently 87% funded. PBGC premiums are current. The plan\'s '
-        'investment committee (3 members of the Board) oversees asset allocation. Recent shift from fixed '
-        'income to alternative investments (12% allocation to PE/hedge funds) may attract fiduciary scrutiny.',
-
-        'The ESOP underwent a Section 409(a) valuation in December 2025. The independent appraiser '
-        '(Stout Risius Ross) valued shares at $20.14 per share. Market price on valuation date was '
-        '$17.42. The premium of 15.6% over market is within acceptable range per DOL guidance but could '
-        'face challenge if stock price declines significantly.',
-    ]
-    for r in risks:
-        add_body(doc, r)
+    add_body_batch(doc, _FID_RISKS)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ── Loss History ──
     add_heading_styled(doc, 'Part VIII — Claims History (5 Years)', level=2)
 
-    claims_table = doc.add_table(rows=8, cols=6, style='Table Grid')
-    claims_headers = ['Year', 'Claim Type', 'Description', 'Paid', 'Reserve', 'Status']
-    for j, h in enumerate(claims_headers):
-        claims_table.cell(0, j).text = h
-    style_header_row(claims_table.rows[0])
-
-    claims_data = [
-        ('2025', 'Securities\nClass Action', 'Shareholder suit alleging misleading statements '
-         'about patient volume projections in Q2 2025 earnings call. Lead plaintiff: '
-         'Midwest Pension Trust.', '$0', '$4,200,000', 'OPEN\nDisc.'),
-        ('2024', 'EPLI', 'Former Chief Nursing Officer alleged wrongful termination '
-         'and gender discrimination. Settled at mediation.', '$680,000', '$0', 'CLOSED'),
-        ('2024', 'Derivative\nSuit', 'Shareholder derivative action alleging waste of '
-         'corporate assets related to failed EHR system implementation ($42M write-off). '
-         'Demand refused. Suit filed in Delaware Chancery.', '$1,240,000', '$0', 'CLOSED\n(Settled)'),
-        ('2023', 'FLSA\nClass Action', 'Nurse overtime class action — 3,200 class members. '
-         'NOT COVERED under D&O (wage/hour exclusion). Company paid from operating funds.',
-         'N/A\n(Excluded)', 'N/A', 'CLOSED\n$4.2M'),
-        ('2023', 'Fiduciary', '401(k) excessive fee suit (Garcia v. Pinnacle). Defense costs '
-         'covered under fiduciary policy. Dismissed on SJ — appeal pending.',
-         '$486,000\n(Defense)', '$200,000', 'OPEN\nAppeal'),
-        ('2022', 'Regulatory', 'DOJ/OIG investigation re: billing practices at 3 surgery '
-         'centers. No charges filed. Defense costs only.',
-         '$1,840,000\n(Defense)', '$0', 'CLOSED'),
-        ('2021', 'D&O\n(Side A)', 'Former CEO/founder sued individually by PE investor '
-         'alleging breach of representations in 2019 recapitalization. Non-indemnifiable '
-         'by company per Delaware law. Settled confidentially.',
-         '$2,400,000', '$0', 'CLOSED'),
-    ]
-    for i, (year, ctype, desc, paid, reserve, status) in enumerate(claims_data):
-        claims_table.cell(i + 1, 0).text = year
-        claims_table.cell(i + 1, 1).text = ctype
-        claims_table.cell(i + 1, 2).text = desc
-        claims_table.cell(i + 1, 3).text = paid
-        claims_table.cell(i + 1, 4).text = reserve
-        claims_table.cell(i + 1, 5).text = status
-        for j in range(6):
-            for p in claims_table.cell(i + 1, j).paragraphs:
-                for run in p.runs:
-                    run.font.size = Pt(8)
-
-    doc.add_paragraph()
+    doc.element.body._insert_tbl(build_table_xml(_CLAIMS_HEADER, _CLAIMS_ROWS, font_half_pts=16))
+
+    add_spacer(doc)
     add_body(doc, '5-Year D&O/Fiduciary Incurred: $11,046,000 (including $4,166,000 defense costs)', bold=True)
     add_body(doc, 'Note: The open securities class action (2025) has reserve of $4.2M against a $15M limit. '
              'If this claim develops adversely, it could consume 28% of the policy limit. Excess carriers '
              '(Chubb Layer 2) have been put on notice.')
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
     # ── UW Conditions ──
     add_heading_styled(doc, 'Part IX — Special Underwriting Conditions', level=2)
-    conditions = [
-        '1. SECURITIES CLAIM REPORTING: Any Securities Claim must be reported within 15 days of service of '
-        'process on any Insured Person. Late reporting may result in coverage denial.',
-
-        '2. INDEPENDENT COUNSEL: AIG has the right to approve defense counsel selected by the Insured. '
-        'Pre-approved panel firms for securities matters: Sullivan & Cromwell, Skadden Arps, Gibson Dunn, '
-        'Latham & Watkins. Maximum hourly rates: Partners: $1,450, Associates: $875, Paralegals: $425.',
-
-        '3. ALLOCATION: Where a Claim involves both covered and uncovered matters, or both Insured Persons '
-        'and non-insured parties, AIG and the Insured shall use best efforts to agree on a fair and proper '
-        'allocation. If unable to agree, the matter shall be submitted to binding arbitration per AAA rules.',
-
-        '4. HAMMER CLAUSE (Modified): If AIG recommends settlement of a Claim and the Insured refuses, '
-        'AIG\'s liability shall not exceed: (a) the recommended settlement amount, plus (b) 70% of any '
-        'additional Loss incurred above the settlement amount, plus (c) defense costs incurred prior to '
-        'the settlement recommendation. The 30/70 split applies (70% AIG, 30% Insured).',
-
-        '5. CHANGE OF CONTROL: If during the Policy Period there is a Change of Control (acquisition of >50% '
-        'of voting securities, merger, or asset sale), coverage under this policy shall: (a) continue for '
-        'Wrongful Acts occurring prior to the Change of Control date; (b) terminate for Wrongful Acts '
-        'occurring after the Change of Control date; and (c) an automatic 6-year Discovery Period shall '
-        'apply at no additional premium for Side A only.',
-
-        '6. PENDING MATTERS — SCHEDULE A: The following matters are known to AIG and are excluded from '
-        'coverage (or subject to sublimits as noted): (a) Garcia v. Pinnacle — 401(k) fee suit (Fiduciary '
-        'sublimit: $2M); (b) Midwest Pension Trust v. Pinnacle — securities class action (currently covered, '
-        'reserves established); (c) TCEQ investigation of subsidiary medical waste disposal practices '
-        '(not yet a formal Claim — monitoring).',
-    ]
-    for c in conditions:
-        add_body(doc, c)
-
-    doc.add_paragraph()
-    p = doc.add_paragraph()
-    run = p.add_run(
-        'This policy is issued on a Claims-Made and Reported basis. Only Claims first made against an '
-        'Insured during the Policy Period (or applicable Extended Reporting Period) AND reported to AIG '
-        'during the Policy Period (or within 60 days after expiration) are covered. The Retroactive Date '
-        'limits coverage to Wrongful Acts occurring on or after January 1, 2018. No coverage is provided '
-        'for any Wrongful Act occurring prior to this date.'
-    )
-    run.font.size = Pt(8.5)
-    run.font.color.rgb = MUTED_RGB
-    run.italic = True
+    add_body_batch(doc, _UW_CONDITIONS)
+
+    add_spacer(doc)
+    add_run_paragraph(doc, _CLAIMS_MADE_NOTE, _NOTE_FMT)
 
-    doc.save(path)
+    path.write_bytes(_docx_bytes(doc))
     print(f"  Created: {path}")
 
 
 # ============================================================
 # MAIN
 # ============================================================
+GENERATORS = (
+    generate_workers_comp_retro,
+    generate_excess_umbrella,
+    generate_cat_loss_report,
+    generate_do_fiduciary,
+)
+
+
 if __name__ == '__main__':
     print("Generating complex test documents...")
     print()
-    generate_workers_comp_retro()
-    generate_excess_umbrella()
-    generate_cat_loss_report()
-    generate_do_fiduciary()
+    # Each generator writes its own file and shares no state, so they run
+    # in separate processes to sidestep the GIL during layout. One worker per
+    # generator: with the fork start method the pool starts every worker up
+    # front, so the default of one per CPU would fork processes that never run.
+    with ProcessPoolExecutor(max_workers=len(GENERATORS)) as pool:
+        for future in [pool.submit(fn, _OUT) for fn in GENERATORS]:
+            future.result()
     print()
     print("Done — all complex test documents generated.")
@@ -6,10 +6,13 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, HRFlowable
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Table,
+    TableStyle, PageBreak, HRFlowable
 )
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import io
 import os
 
 OUT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -31,72 +34,105 @@ LIGHT_BLUE = colors.HexColor('#e8edf5')
 BORDER_GRAY = colors.HexColor('#cbd5e1')
 ROW_ALT = colors.HexColor('#f8fafc')
 
+_HEADER_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (0,0), 20),
+    ('TEXTCOLOR', (0,0), (0,0), AIG_BLUE),
+    ('FONTNAME', (1,0), (1,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (1,0), (1,0), 14),
+    ('TEXTCOLOR', (1,0), (1,0), AIG_BLUE),
+    ('FONTSIZE', (1,1), (1,1), 9),
+    ('TEXTCOLOR', (1,1), (1,1), colors.HexColor('#64748b')),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 2),
+    ('TOPPADDING', (0,0), (-1,-1), 2),
+])
+
+_STYLED_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), AIG_BLUE),
+    ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,0), 8.5),
+    ('FONTSIZE', (0,1), (-1,-1), 8.5),
+    ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
+    ('ALIGN', (0,0), (-1,0), 'CENTER'),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ('GRID', (0,0), (-1,-1), 0.5, BORDER_GRAY),
+    ('TOPPADDING', (0,0), (-1,-1), 5),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 5),
+    ('LEFTPADDING', (0,0), (-1,-1), 6),
+    ('RIGHTPADDING', (0,0), (-1,-1), 6),
+])
+
+_KV_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,-1), 9),
+    ('TEXTCOLOR', (0,0), (0,-1), colors.HexColor('#1e293b')),
+    ('TEXTCOLOR', (1,0), (1,-1), colors.HexColor('#334155')),
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+    ('TOPPADDING', (0,0), (-1,-1), 4),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 4),
+    ('LINEBELOW', (0,0), (-1,-2), 0.5, colors.HexColor('#e2e8f0')),
+    ('LEFTPADDING', (0,0), (-1,-1), 0),
+])
+
+_FIN_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,-1), 9),
+    ('BACKGROUND', (0,0), (-1,0), LIGHT_BLUE),
+    ('GRID', (0,0), (-1,-1), 0.5, BORDER_GRAY),
+    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+    ('TOPPADDING', (0,0), (-1,-1), 5),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 5),
+])
+
+# Column widths shared by every report; each table is 6.5" wide.
+_HEADER_COLS = (1.2*inch, 5.3*inch)
+_KV_COLS = (2.2*inch, 4.3*inch)
+_SIG_COLS = (2.8*inch, 0.9*inch, 2.8*inch)
+
+@lru_cache(maxsize=None)
+def _even_widths(n_cols):
+    return (6.5*inch / n_cols,) * n_cols
+
 def header_table(title_lines):
     """Create a standard AIG header block."""
     data = [
         ['AIG', title_lines[0]],
         ['', title_lines[1] if len(title_lines) > 1 else ''],
     ]
-    t = Table(data, colWidths=[1.2*inch, 5.3*inch])
-    t.setStyle(TableStyle([
-        ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (0,0), 20),
-        ('TEXTCOLOR', (0,0), (0,0), AIG_BLUE),
-        ('FONTNAME', (1,0), (1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (1,0), (1,0), 14),
-        ('TEXTCOLOR', (1,0), (1,0), AIG_BLUE),
-        ('FONTSIZE', (1,1), (1,1), 9),
-        ('TEXTCOLOR', (1,1), (1,1), colors.HexColor('#64748b')),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 2),
-        ('TOPPADDING', (0,0), (-1,-1), 2),
-    ]))
+    t = Table(data, colWidths=_HEADER_COLS)
+    t.setStyle(_HEADER_TABLE_STYLE)
     return t
 
 def styled_table(headers, rows, col_widths=None):
     """Create a consistently styled data table."""
-    data = [headers] + rows
+    data = [headers, *rows]
     if not col_widths:
-        col_widths = [6.5*inch / len(headers)] * len(headers)
+        col_widths = _even_widths(len(headers))
     t = Table(data, colWidths=col_widths, repeatRows=1)
-    style = [
-        ('BACKGROUND', (0,0), (-1,0), AIG_BLUE),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.white),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,0), 8.5),
-        ('FONTSIZE', (0,1), (-1,-1), 8.5),
-        ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
-        ('ALIGN', (0,0), (-1,0), 'CENTER'),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('GRID', (0,0), (-1,-1), 0.5, BORDER_GRAY),
-        ('TOPPADDING', (0,0), (-1,-1), 5),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 5),
-        ('LEFTPADDING', (0,0), (-1,-1), 6),
-        ('RIGHTPADDING', (0,0), (-1,-1), 6),
-    ]
-    for i in range(1, len(data)):
+    t.setStyle(_STYLED_TABLE_STYLE)
+    t.setStyle(_row_bands(len(data)))
+    return t
+
+@lru_cache(maxsize=None)
+def _row_bands(n_rows):
+    """Alternate-row shading for a table of ``n_rows`` rows, header included."""
+    # Explicit per-row fills rather than ROWBACKGROUNDS: the coverage schedule
+    # splits across pages, and ROWBACKGROUNDS restarts its cycle on the
+    # continuation, which would flip the banding after the repeated header.
+    style = []
+    for i in range(1, n_rows):
         if i % 2 == 0:
             style.append(('BACKGROUND', (0,i), (-1,i), ROW_ALT))
-    t.setStyle(TableStyle(style))
-    return t
+    return TableStyle(style)
 
 def kv_table(pairs, col_widths=None):
     """Key-value pair table."""
     if not col_widths:
-        col_widths = [2.2*inch, 4.3*inch]
+        col_widths = _KV_COLS
     t = Table(pairs, colWidths=col_widths)
-    style = [
-        ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 9),
-        ('TEXTCOLOR', (0,0), (0,-1), colors.HexColor('#1e293b')),
-        ('TEXTCOLOR', (1,0), (1,-1), colors.HexColor('#334155')),
-        ('VALIGN', (0,0), (-1,-1), 'TOP'),
-        ('TOPPADDING', (0,0), (-1,-1), 4),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-        ('LINEBELOW', (0,0), (-1,-2), 0.5, colors.HexColor('#e2e8f0')),
-        ('LEFTPADDING', (0,0), (-1,-1), 0),
-    ]
-    t.setStyle(TableStyle(style))
+    t.setStyle(_KV_TABLE_STYLE)
     return t
 
 def add_footer(canvas, doc):
@@ -107,65 +143,90 @@ def add_footer(canvas, doc):
         f"AIG  |  Confidential  |  Page {doc.page}")
     canvas.restoreState()
 
+# One letter-size page layout for every report: a single body frame inside
+# 0.75" side, 0.6" top and 0.7" bottom margins, with the footer on each page.
+_PAGE_TEMPLATE = PageTemplate(
+    id='page',
+    frames=[Frame(0.75*inch, 0.7*inch, 7.0*inch, 9.7*inch, id='body')],
+    onPage=add_footer,
+)
+
+def pdf_bytes(story):
+    """Lay out the story and return the finished PDF.
+
+    ``build`` consumes the story as it goes, so the flowables are released
+    page by page instead of being held until the PDF is finished.
+    """
+    buf = io.BytesIO()
+    BaseDocTemplate(buf, pagesize=letter, pageTemplates=[_PAGE_TEMPLATE]).build(story)
+    return buf.getvalue()
+
+def write_pdf(path, data):
+    with open(path, 'wb') as fh:
+        fh.write(data)
+
 
 # ============================================================
 # 1. COMMERCIAL PROPERTY POLICY
 # ============================================================
+_COVERAGE_COLS = (2.0*inch, 1.2*inch, 1.2*inch, 0.9*inch, 1.2*inch)
+_LOCATION_COLS = (0.4*inch, 1.4*inch, 0.9*inch, 0.7*inch, 0.6*inch, 0.6*inch, 0.8*inch, 1.1*inch)
+_ENDORSEMENT_COLS = (1.0*inch, 0.7*inch, 3.5*inch, 1.3*inch)
+_LOSS_HISTORY_COLS = (0.9*inch, 0.9*inch, 1.1*inch, 0.7*inch, 1.1*inch, 0.8*inch, 1.0*inch)
+_LARGE_LOSS_COLS = (0.8*inch, 0.5*inch, 0.7*inch, 2.2*inch, 0.8*inch, 0.6*inch)
+
 def generate_commercial_property_policy():
     path = os.path.join(OUT_DIR, 'Commercial_Property_Policy_Meridian_Steel.pdf')
-    doc = SimpleDocTemplate(path, pagesize=letter,
-        topMargin=0.6*inch, bottomMargin=0.7*inch,
-        leftMargin=0.75*inch, rightMargin=0.75*inch)
     story = []
 
     # Header
-    story.append(header_table([
+    story.append(header_table((
         'Commercial Property Policy',
         'Policy No: AIG-CPP-2026-04871  |  Effective: 03/01/2026 - 03/01/2027'
-    ]))
+    )))
     story.append(Spacer(1, 6))
     story.append(HRFlowable(width="100%", thickness=2, color=AIG_BLUE))
     story.append(Spacer(1, 16))
 
     # Declarations
     story.append(Paragraph('SECTION I — DECLARATIONS', styles['SectionHead']))
-    story.append(kv_table([
-        ['Named Insured:', 'Meridian Steel Corporation'],
-        ['DBA:', 'Meridian Steel Manufacturing & Distribution'],
-        ['Mailing Address:', '4200 Industrial Parkway, Suite 100\nHouston, TX 77041'],
-        ['FEIN:', '74-3298156'],
-        ['SIC Code:', '3312 — Steel Works, Blast Furnaces'],
-        ['NAICS Code:', '331110 — Iron and Steel Mills and Ferroalloy Manufacturing'],
-        ['Policy Period:', 'March 1, 2026, 12:01 AM to March 1, 2027, 12:01 AM\nStandard Time at the address shown above'],
-        ['Producer:', 'Marsh & McLennan Companies\nAttn: David Chen, SVP\nLicense No: TX-7841205'],
-        ['Premium:', '$287,500 (Annual)  |  Deposit: $143,750'],
-        ['Policy Form:', 'AIG Advantage Property Premier (AIG-PP-2026)'],
-    ]))
+    story.append(kv_table((
+        ('Named Insured:', 'Meridian Steel Corporation'),
+        ('DBA:', 'Meridian Steel Manufacturing & Distribution'),
+        ('Mailing Address:', '4200 Industrial Parkway, Suite 100\nHouston, TX 77041'),
+        ('FEIN:', '74-3298156'),
+        ('SIC Code:', '3312 — Steel Works, Blast Furnaces'),
+        ('NAICS Code:', '331110 — Iron and Steel Mills and Ferroalloy Manufacturing'),
+        ('Policy Period:', 'March 1, 2026, 12:01 AM to March 1, 2027, 12:01 AM\nStandard Time at the address shown above'),
+        ('Producer:', 'Marsh & McLennan Companies\nAttn: David Chen, SVP\nLicense No: TX-7841205'),
+        ('Premium:', '$287,500 (Annual)  |  Deposit: $143,750'),
+        ('Policy Form:', 'AIG Advantage Property Premier (AIG-PP-2026)'),
+    )))
     story.append(Spacer(1, 12))
 
     # Coverage Summary
     story.append(Paragraph('SECTION II — SCHEDULE OF COVERAGES & LIMITS', styles['SectionHead']))
     story.append(styled_table(
-        ['Coverage', 'Limit', 'Deductible', 'Coinsurance', 'Valuation'],
-        [
-            ['Building — Loc 1', '$42,500,000', '$25,000', '90%', 'Replacement Cost'],
-            ['Building — Loc 2', '$18,750,000', '$25,000', '90%', 'Replacement Cost'],
-            ['Business Personal Property — Loc 1', '$15,200,000', '$10,000', '80%', 'Replacement Cost'],
-            ['Business Personal Property — Loc 2', '$8,400,000', '$10,000', '80%', 'Replacement Cost'],
-            ['Business Income w/ Extra Expense', '$12,000,000', '72-hr waiting', 'N/A', '12-month ALS'],
-            ['Equipment Breakdown', '$5,000,000', '$10,000', 'N/A', 'Replacement Cost'],
-            ['Ordinance or Law — Coverage A', '$2,500,000', 'Per Building Ded', 'N/A', 'ACV'],
-            ['Ordinance or Law — Coverage B', '$2,500,000', 'Per Building Ded', 'N/A', 'RC'],
-            ['Ordinance or Law — Coverage C', '$5,000,000', 'Per Building Ded', 'N/A', 'RC'],
-            ['Flood — Loc 1 (Zone X)', '$5,000,000', '$100,000', 'N/A', 'RC'],
-            ['Flood — Loc 2 (Zone AE)', '$2,500,000', '$250,000', 'N/A', 'RC'],
-            ['Named Storm — All Locations', '$10,000,000', '3% TIV / $500K min', 'N/A', 'RC'],
-            ['Earthquake — All Locations', '$5,000,000', '5% TIV / $250K min', 'N/A', 'RC'],
-            ['Transit / Inland Marine', '$2,000,000', '$5,000', 'N/A', 'RC'],
-            ['Valuable Papers & Records', '$500,000', '$2,500', 'N/A', 'RC'],
-            ['Accounts Receivable', '$1,000,000', '$2,500', 'N/A', 'N/A'],
-        ],
-        col_widths=[2.0*inch, 1.2*inch, 1.2*inch, 0.9*inch, 1.2*inch]
+        ('Coverage', 'Limit', 'Deductible', 'Coinsurance', 'Valuation'),
+        (
+            ('Building — Loc 1', '$42,500,000', '$25,000', '90%', 'Replacement Cost'),
+            ('Building — Loc 2', '$18,750,000', '$25,000', '90%', 'Replacement Cost'),
+            ('Business Personal Property — Loc 1', '$15,200,000', '$10,000', '80%', 'Replacement Cost'),
+            ('Business Personal Property — Loc 2', '$8,400,000', '$10,000', '80%', 'Replacement Cost'),
+            ('Business Income w/ Extra Expense', '$12,000,000', '72-hr waiting', 'N/A', '12-month ALS'),
+            ('Equipment Breakdown', '$5,000,000', '$10,000', 'N/A', 'Replacement Cost'),
+            ('Ordinance or Law — Coverage A', '$2,500,000', 'Per Building Ded', 'N/A', 'ACV'),
+            ('Ordinance or Law — Coverage B', '$2,500,000', 'Per Building Ded', 'N/A', 'RC'),
+            ('Ordinance or Law — Coverage C', '$5,000,000', 'Per Building Ded', 'N/A', 'RC'),
+            ('Flood — Loc 1 (Zone X)', '$5,000,000', '$100,000', 'N/A', 'RC'),
+            ('Flood — Loc 2 (Zone AE)', '$2,500,000', '$250,000', 'N/A', 'RC'),
+            ('Named Storm — All Locations', '$10,000,000', '3% TIV / $500K min', 'N/A', 'RC'),
+            ('Earthquake — All Locations', '$5,000,000', '5% TIV / $250K min', 'N/A', 'RC'),
+            ('Transit / Inland Marine', '$2,000,000', '$5,000', 'N/A', 'RC'),
+            ('Valuable Papers & Records', '$500,000', '$2,500', 'N/A', 'RC'),
+            ('Accounts Receivable', '$1,000,000', '$2,500', 'N/A', 'N/A'),
+        ),
+        col_widths=_COVERAGE_COLS
     ))
     story.append(Spacer(1, 8))
     story.append(Paragraph('<b>Aggregate Policy Limit:</b> $85,000,000 per occurrence / $170,000,000 annual aggregate', styles['BodyText2']))
@@ -175,34 +236,34 @@ def generate_commercial_property_policy():
     # Locations
     story.append(Paragraph('SECTION III — SCHEDULE OF LOCATIONS', styles['SectionHead']))
     story.append(styled_table(
-        ['Loc #', 'Address', 'Occupancy', 'Const.', 'Year Built', 'Sq Ft', 'Sprinkler', 'TIV'],
-        [
-            ['1', '4200 Industrial Pkwy\nHouston, TX 77041', 'Manufacturing\n& Warehouse', 'Fire\nResistive', '2008', '120,000', 'Full ESFR\nNFPA 13', '$57,700,000'],
-            ['2', '8901 Port Arthur Rd\nBeaumont, TX 77705', 'Distribution\nCenter', 'Masonry\nNon-Comb', '2015', '65,000', 'Wet Pipe\nNFPA 13', '$27,150,000'],
-        ],
-        col_widths=[0.4*inch, 1.4*inch, 0.9*inch, 0.7*inch, 0.6*inch, 0.6*inch, 0.8*inch, 1.1*inch]
+        ('Loc #', 'Address', 'Occupancy', 'Const.', 'Year Built', 'Sq Ft', 'Sprinkler', 'TIV'),
+        (
+            ('1', '4200 Industrial Pkwy\nHouston, TX 77041', 'Manufacturing\n& Warehouse', 'Fire\nResistive', '2008', '120,000', 'Full ESFR\nNFPA 13', '$57,700,000'),
+            ('2', '8901 Port Arthur Rd\nBeaumont, TX 77705', 'Distribution\nCenter', 'Masonry\nNon-Comb', '2015', '65,000', 'Wet Pipe\nNFPA 13', '$27,150,000'),
+        ),
+        col_widths=_LOCATION_COLS
     ))
     story.append(Spacer(1, 12))
 
     # Endorsements
     story.append(Paragraph('SECTION IV — ENDORSEMENT SCHEDULE', styles['SectionHead']))
     story.append(styled_table(
-        ['Form No.', 'Edition', 'Endorsement Title', 'Premium +/-'],
-        [
-            ['AIG-PP-001', '01/2026', 'Agreed Value Endorsement (Waiver of Coinsurance)', 'Included'],
-            ['AIG-PP-002', '01/2026', 'Blanket Limits — Buildings & BPP', 'Included'],
-            ['AIG-PP-003', '01/2026', 'Business Income — Extended Period of Indemnity (365 days)', '+$4,200'],
-            ['AIG-PP-004', '01/2026', 'Utility Services — Direct Damage & Time Element', 'Included'],
-            ['AIG-PP-005', '01/2026', 'Fungus, Wet Rot, Dry Rot — Limited Coverage ($100K)', 'Included'],
-            ['AIG-PP-006', '01/2026', 'Electronic Data — Expanded Coverage ($250K)', '+$1,800'],
-            ['AIG-PP-007', '01/2026', 'Ordinance or Law — Increased Coverage', 'Included'],
-            ['AIG-PP-008', '01/2026', 'Protective Safeguards — P-1, P-2, P-9', 'Warranty'],
-            ['AIG-PP-009', '01/2026', 'Water Exclusion — Amended (Storm Surge Buyback)', '+$12,500'],
-            ['AIG-PP-010', '01/2026', 'Terrorism Risk Insurance Act (TRIA) — Certified Acts', '+$3,400'],
-            ['CP 99 33', '10/2012', 'Exclusion of Loss Due to Virus or Bacteria', 'N/A'],
-            ['IL 09 35', '07/2022', 'Exclusion of Certain Computer-Related Losses', 'N/A'],
-        ],
-        col_widths=[1.0*inch, 0.7*inch, 3.5*inch, 1.3*inch]
+        ('Form No.', 'Edition', 'Endorsement Title', 'Premium +/-'),
+        (
+            ('AIG-PP-001', '01/2026', 'Agreed Value Endorsement (Waiver of Coinsurance)', 'Included'),
+            ('AIG-PP-002', '01/2026', 'Blanket Limits — Buildings & BPP', 'Included'),
+            ('AIG-PP-003', '01/2026', 'Business Income — Extended Period of Indemnity (365 days)', '+$4,200'),
+            ('AIG-PP-004', '01/2026', 'Utility Services — Direct Damage & Time Element', 'Included'),
+            ('AIG-PP-005', '01/2026', 'Fungus, Wet Rot, Dry Rot — Limited Coverage ($100K)', 'Included'),
+            ('AIG-PP-006', '01/2026', 'Electronic Data — Expanded Coverage ($250K)', '+$1,800'),
+            ('AIG-PP-007', '01/2026', 'Ordinance or Law — Increased Coverage', 'Included'),
+            ('AIG-PP-008', '01/2026', 'Protective Safeguards — P-1, P-2, P-9', 'Warranty'),
+            ('AIG-PP-009', '01/2026', 'Water Exclusion — Amended (Storm Surge Buyback)', '+$12,500'),
+            ('AIG-PP-010', '01/2026', 'Terrorism Risk Insurance Act (TRIA) — Certified Acts', '+$3,400'),
+            ('CP 99 33', '10/2012', 'Exclusion of Loss Due to Virus or Bacteria', 'N/A'),
+            ('IL 09 35', '07/2022', 'Exclusion of Certain Computer-Related Losses', 'N/A'),
+        ),
+        col_widths=_ENDORSEMENT_COLS
     ))
 
     story.append(PageBreak())
@@ -212,15 +273,15 @@ def generate_commercial_property_policy():
     story.append(Paragraph('Source: Meridian Steel Corp — verified via carrier loss runs and TPA reports.', styles['SmallGray']))
     story.append(Spacer(1, 6))
     story.append(styled_table(
-        ['Policy Year', 'Carrier', 'Earned Premium', '# Claims', 'Incurred Losses', 'Loss Ratio', 'Status'],
-        [
-            ['2025-2026', 'AIG (Current)', '$287,500', '2', '$84,200', '29.3%', 'Open (1)'],
-            ['2024-2025', 'Zurich', '$265,000', '4', '$312,450', '117.9%', 'All Closed'],
-            ['2023-2024', 'Zurich', '$248,000', '1', '$18,700', '7.5%', 'All Closed'],
-            ['2022-2023', 'Chubb', '$242,000', '3', '$156,800', '64.8%', 'All Closed'],
-            ['2021-2022', 'Chubb', '$235,000', '0', '$0', '0.0%', 'All Closed'],
-        ],
-        col_widths=[0.9*inch, 0.9*inch, 1.1*inch, 0.7*inch, 1.1*inch, 0.8*inch, 1.0*inch]
+        ('Policy Year', 'Carrier', 'Earned Premium', '# Claims', 'Incurred Losses', 'Loss Ratio', 'Status'),
+        (
+            ('2025-2026', 'AIG (Current)', '$287,500', '2', '$84,200', '29.3%', 'Open (1)'),
+            ('2024-2025', 'Zurich', '$265,000', '4', '$312,450', '117.9%', 'All Closed'),
+            ('2023-2024', 'Zurich', '$248,000', '1', '$18,700', '7.5%', 'All Closed'),
+            ('2022-2023', 'Chubb', '$242,000', '3', '$156,800', '64.8%', 'All Closed'),
+            ('2021-2022', 'Chubb', '$235,000', '0', '$0', '0.0%', 'All Closed'),
+        ),
+        col_widths=_LOSS_HISTORY_COLS
     ))
     story.append(Spacer(1, 8))
     story.append(Paragraph('<b>5-Year Combined Incurred:</b> $572,150  |  <b>Avg Loss Ratio:</b> 43.9%  |  <b>Large Loss ($50K+):</b> 2 claims', styles['BodyText2']))
@@ -228,12 +289,12 @@ def generate_commercial_property_policy():
 
     story.append(Paragraph('Large Loss Detail:', styles['SubSection']))
     story.append(styled_table(
-        ['Date of Loss', 'Location', 'Cause', 'Description', 'Incurred', 'Status'],
-        [
-            ['06/14/2024', 'Loc 1', 'Wind/Hail', 'Severe thunderstorm — roof membrane damage,\nHVAC unit destruction, 3-week production delay', '$248,000', 'Closed'],
-            ['11/02/2022', 'Loc 2', 'Equipment\nBreakdown', 'Transformer failure — electrical surge damaged\nconveyor systems and control panels', '$142,300', 'Closed'],
-        ],
-        col_widths=[0.8*inch, 0.5*inch, 0.7*inch, 2.2*inch, 0.8*inch, 0.6*inch]
+        ('Date of Loss', 'Location', 'Cause', 'Description', 'Incurred', 'Status'),
+        (
+            ('06/14/2024', 'Loc 1', 'Wind/Hail', 'Severe thunderstorm — roof membrane damage,\nHVAC unit destruction, 3-week production delay', '$248,000', 'Closed'),
+            ('11/02/2022', 'Loc 2', 'Equipment\nBreakdown', 'Transformer failure — electrical surge damaged\nconveyor systems and control panels', '$142,300', 'Closed'),
+        ),
+        col_widths=_LARGE_LOSS_COLS
     ))
 
     story.append(PageBreak())
@@ -257,13 +318,13 @@ def generate_commercial_property_policy():
     story.append(Paragraph('SECTION VII — SIGNATURES', styles['SectionHead']))
     story.append(Spacer(1, 20))
 
-    sig_data = [
-        ['_' * 40, '', '_' * 40],
-        ['Authorized Representative', '', 'Named Insured or Authorized Agent'],
-        ['AIG Property Division', '', 'Meridian Steel Corporation'],
-        ['Date: _______________', '', 'Date: _______________'],
-    ]
-    sig_table = Table(sig_data, colWidths=[2.8*inch, 0.9*inch, 2.8*inch])
+    sig_data = (
+        ('_' * 40, '', '_' * 40),
+        ('Authorized Representative', '', 'Named Insured or Authorized Agent'),
+        ('AIG Property Division', '', 'Meridian Steel Corporation'),
+        ('Date: _______________', '', 'Date: _______________'),
+    )
+    sig_table = Table(sig_data, colWidths=_SIG_COLS)
     sig_table.setStyle(TableStyle([
         ('FONTSIZE', (0,0), (-1,-1), 9),
         ('FONTNAME', (0,1), (-1,1), 'Helvetica-Bold'),
@@ -273,59 +334,60 @@ def generate_commercial_property_policy():
     ]))
     story.append(sig_table)
 
-    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    write_pdf(path, pdf_bytes(story))
     print(f"  Created: {path}")
 
 
 # ============================================================
 # 2. ACORD 125 — COMMERCIAL INSURANCE APPLICATION
 # ============================================================
+_ACORD_COVERAGE_COLS = (1.4*inch, 1.2*inch, 1.2*inch, 1.1*inch, 0.8*inch)
+_PREMISES_COLS = (0.3*inch, 1.4*inch, 1.0*inch, 0.6*inch, 0.8*inch, 0.7*inch, 1.0*inch)
+_ACORD_LOSS_COLS = (0.5*inch, 0.6*inch, 0.6*inch, 0.9*inch, 0.9*inch, 3.0*inch)
+
 def generate_acord_application():
     path = os.path.join(OUT_DIR, 'ACORD_125_Application_Pacific_Coast_Logistics.pdf')
-    doc = SimpleDocTemplate(path, pagesize=letter,
-        topMargin=0.6*inch, bottomMargin=0.7*inch,
-        leftMargin=0.75*inch, rightMargin=0.75*inch)
     story = []
 
-    story.append(header_table([
+    story.append(header_table((
         'ACORD 125 — Commercial Insurance Application',
         'Date: 02/15/2026  |  Producer: Aon Risk Solutions'
-    ]))
+    )))
     story.append(Spacer(1, 6))
     story.append(HRFlowable(width="100%", thickness=2, color=AIG_BLUE))
     story.append(Spacer(1, 14))
 
     # Applicant Info
     story.append(Paragraph('SECTION 1 — APPLICANT INFORMATION', styles['SectionHead']))
-    story.append(kv_table([
-        ['Applicant Name:', 'Pacific Coast Logistics, Inc.'],
-        ['DBA:', 'PCL Freight Services'],
-        ['Mailing Address:', '2750 Harbor Gateway Blvd\nLong Beach, CA 90810'],
-        ['Phone:', '(562) 555-0147'],
-        ['Website:', 'www.pacificcoastlogistics.com'],
-        ['FEIN:', '95-4812903'],
-        ['Entity Type:', 'S-Corporation — Incorporated in California (2011)'],
-        ['SIC / NAICS:', '4731 / 488510 — Freight Transportation Arrangement'],
-        ['Years in Business:', '15 years (est. 2011)'],
-        ['Annual Revenue:', '$78,400,000 (FY 2025)'],
-        ['Total Employees:', '342 (Full-Time: 298, Part-Time: 44)'],
-    ]))
+    story.append(kv_table((
+        ('Applicant Name:', 'Pacific Coast Logistics, Inc.'),
+        ('DBA:', 'PCL Freight Services'),
+        ('Mailing Address:', '2750 Harbor Gateway Blvd\nLong Beach, CA 90810'),
+        ('Phone:', '(562) 555-0147'),
+        ('Website:', 'www.pacificcoastlogistics.com'),
+        ('FEIN:', '95-4812903'),
+        ('Entity Type:', 'S-Corporation — Incorporated in California (2011)'),
+        ('SIC / NAICS:', '4731 / 488510 — Freight Transportation Arrangement'),
+        ('Years in Business:', '15 years (est. 2011)'),
+        ('Annual Revenue:', '$78,400,000 (FY 2025)'),
+        ('Total Employees:', '342 (Full-Time: 298, Part-Time: 44)'),
+    )))
     story.append(Spacer(1, 10))
 
     # Lines of Business Requested
     story.append(Paragraph('SECTION 2 — COVERAGES REQUESTED', styles['SectionHead']))
     story.append(styled_table(
-        ['Line of Business', 'Requested Limit', 'Current Carrier', 'Expiring Premium', 'Exp. Date'],
-        [
-            ['Commercial Property', '$45,000,000', 'Travelers', '$186,400', '04/01/2026'],
-            ['General Liability', '$2M occ / $4M agg', 'Hartford', '$124,800', '04/01/2026'],
-            ['Commercial Auto', '$1M CSL', 'Progressive Comm', '$287,600', '04/01/2026'],
-            ['Umbrella / Excess', '$10,000,000', 'Chubb', '$42,000', '04/01/2026'],
-            ['Workers Compensation', 'Statutory / $1M EL', 'SCIF', '$198,200', '04/01/2026'],
-            ['Inland Marine', '$5,000,000', 'Travelers', '$18,900', '04/01/2026'],
-            ['Cyber Liability', '$3,000,000', 'None (New)', 'N/A', 'N/A'],
-        ],
-        col_widths=[1.4*inch, 1.2*inch, 1.2*inch, 1.1*inch, 0.8*inch]
+        ('Line of Business', 'Requested Limit', 'Current Carrier', 'Expiring Premium', 'Exp. Date'),
+        (
+            ('Commercial Property', '$45,000,000', 'Travelers', '$186,400', '04/01/2026'),
+            ('General Liability', '$2M occ / $4M agg', 'Hartford', '$124,800', '04/01/2026'),
+            ('Commercial Auto', '$1M CSL', 'Progressive Comm', '$287,600', '04/01/2026'),
+            ('Umbrella / Excess', '$10,000,000', 'Chubb', '$42,000', '04/01/2026'),
+            ('Workers Compensation', 'Statutory / $1M EL', 'SCIF', '$198,200', '04/01/2026'),
+            ('Inland Marine', '$5,000,000', 'Travelers', '$18,900', '04/01/2026'),
+            ('Cyber Liability', '$3,000,000', 'None (New)', 'N/A', 'N/A'),
+        ),
+        col_widths=_ACORD_COVERAGE_COLS
     ))
     story.append(Spacer(1, 8))
     story.append(Paragraph('<b>Total Current Program Premium:</b> $857,900  |  <b>Reason for Marketing:</b> Rate increases at renewal; seeking competitive alternatives and expanded Cyber coverage.', styles['BodyText2']))
@@ -352,13 +414,13 @@ def generate_acord_application():
     # Premises
     story.append(Paragraph('SECTION 4 — PREMISES & LOCATIONS', styles['SectionHead']))
     story.append(styled_table(
-        ['#', 'Location', 'Use', 'Sq Ft', 'Owned/Leased', 'Sprinkler', 'TIV'],
-        [
-            ['1', '2750 Harbor Gateway Blvd\nLong Beach, CA 90810', 'HQ + Cold Storage\nWarehouse', '145,000', 'Leased\n(10yr NNN)', 'Full Wet\nAMPP', '$28,400,000'],
-            ['2', '4401 W Buckeye Rd\nPhoenix, AZ 85043', 'Cold Storage\nDistribution', '125,000', 'Leased\n(7yr NNN)', 'Full Wet\nEarly Sup', '$19,200,000'],
-            ['3', '9800 Forney Rd\nDallas, TX 75227', 'Cold Storage\nCross-Dock', '110,000', 'Owned', 'Full Wet\nNFPA 13', '$22,600,000'],
-        ],
-        col_widths=[0.3*inch, 1.4*inch, 1.0*inch, 0.6*inch, 0.8*inch, 0.7*inch, 1.0*inch]
+        ('#', 'Location', 'Use', 'Sq Ft', 'Owned/Leased', 'Sprinkler', 'TIV'),
+        (
+            ('1', '2750 Harbor Gateway Blvd\nLong Beach, CA 90810', 'HQ + Cold Storage\nWarehouse', '145,000', 'Leased\n(10yr NNN)', 'Full Wet\nAMPP', '$28,400,000'),
+            ('2', '4401 W Buckeye Rd\nPhoenix, AZ 85043', 'Cold Storage\nDistribution', '125,000', 'Leased\n(7yr NNN)', 'Full Wet\nEarly Sup', '$19,200,000'),
+            ('3', '9800 Forney Rd\nDallas, TX 75227', 'Cold Storage\nCross-Dock', '110,000', 'Owned', 'Full Wet\nNFPA 13', '$22,600,000'),
+        ),
+        col_widths=_PREMISES_COLS
     ))
 
     story.append(PageBreak())
@@ -366,23 +428,23 @@ def generate_acord_application():
     # Loss History
     story.append(Paragraph('SECTION 5 — LOSS HISTORY (5 YEARS)', styles['SectionHead']))
     story.append(styled_table(
-        ['Year', 'Line', '# Claims', 'Total Incurred', 'Largest Claim', 'Description'],
-        [
-            ['2025', 'Auto', '8', '$124,300', '$42,000', 'Rear-end collision — driver injury + cargo damage'],
-            ['2025', 'GL', '2', '$18,500', '$14,200', 'Slip & fall at Long Beach facility'],
-            ['2025', 'WC', '12', '$87,400', '$23,100', 'Repetitive stress injuries — warehouse workers'],
-            ['2024', 'Auto', '6', '$78,200', '$31,500', 'Intersection accident — third-party BI claim'],
-            ['2024', 'Property', '1', '$245,000', '$245,000', 'Refrigeration system failure — spoiled inventory'],
-            ['2024', 'WC', '9', '$62,100', '$18,700', 'Forklift incident — ankle fracture'],
-            ['2023', 'Auto', '5', '$56,800', '$28,400', 'Highway merge accident — vehicle totaled'],
-            ['2023', 'GL', '1', '$8,200', '$8,200', 'Damaged customer goods during handling'],
-            ['2023', 'WC', '7', '$48,900', '$15,300', 'Lower back injuries — lifting related'],
-            ['2022', 'Auto', '4', '$34,100', '$18,600', 'Parking lot incident — property damage'],
-            ['2022', 'Property', '0', '$0', 'N/A', 'No claims'],
-            ['2021', 'Auto', '3', '$22,400', '$12,800', 'Minor fender benders — no injuries'],
-            ['2021', 'WC', '5', '$31,200', '$11,400', 'Slip on wet warehouse floor'],
-        ],
-        col_widths=[0.5*inch, 0.6*inch, 0.6*inch, 0.9*inch, 0.9*inch, 3.0*inch]
+        ('Year', 'Line', '# Claims', 'Total Incurred', 'Largest Claim', 'Description'),
+        (
+            ('2025', 'Auto', '8', '$124,300', '$42,000', 'Rear-end collision — driver injury + cargo damage'),
+            ('2025', 'GL', '2', '$18,500', '$14,200', 'Slip & fall at Long Beach facility'),
+            ('2025', 'WC', '12', '$87,400', '$23,100', 'Repetitive stress injuries — warehouse workers'),
+            ('2024', 'Auto', '6', '$78,200', '$31,500', 'Intersection accident — third-party BI claim'),
+            ('2024', 'Property', '1', '$245,000', '$245,000', 'Refrigeration system failure — spoiled inventory'),
+            ('2024', 'WC', '9', '$62,100', '$18,700', 'Forklift incident — ankle fracture'),
+            ('2023', 'Auto', '5', '$56,800', '$28,400', 'Highway merge accident — vehicle totaled'),
+            ('2023', 'GL', '1', '$8,200', '$8,200', 'Damaged customer goods during handling'),
+            ('2023', 'WC', '7', '$48,900', '$15,300', 'Lower back injuries — lifting related'),
+            ('2022', 'Auto', '4', '$34,100', '$18,600', 'Parking lot incident — property damage'),
+            ('2022', 'Property', '0', '$0', 'N/A', 'No claims'),
+            ('2021', 'Auto', '3', '$22,400', '$12,800', 'Minor fender benders — no injuries'),
+            ('2021', 'WC', '5', '$31,200', '$11,400', 'Slip on wet warehouse floor'),
+        ),
+        col_widths=_ACORD_LOSS_COLS
     ))
     story.append(Spacer(1, 8))
     story.append(Paragraph('<b>5-Year Total Incurred:</b> $817,100  |  <b>Total Claims:</b> 63  |  <b>Avg Claim:</b> $12,970', styles['BodyText2']))
@@ -395,13 +457,13 @@ def generate_acord_application():
     story.append(Paragraph(rep_text, styles['BodyText2']))
     story.append(Spacer(1, 24))
 
-    sig_data = [
-        ['_' * 40, '', '_' * 40],
-        ['Applicant Signature', '', 'Producer Signature'],
-        ['Name: Sarah Martinez, CFO', '', 'Name: Rachel Kim, Account Executive'],
-        ['Date: _______________', '', 'Date: _______________'],
-    ]
-    sig_table = Table(sig_data, colWidths=[2.8*inch, 0.9*inch, 2.8*inch])
+    sig_data = (
+        ('_' * 40, '', '_' * 40),
+        ('Applicant Signature', '', 'Producer Signature'),
+        ('Name: Sarah Martinez, CFO', '', 'Name: Rachel Kim, Account Executive'),
+        ('Date: _______________', '', 'Date: _______________'),
+    )
+    sig_table = Table(sig_data, colWidths=_SIG_COLS)
     sig_table.setStyle(TableStyle([
         ('FONTSIZE', (0,0), (-1,-1), 9),
         ('FONTNAME', (0,1), (-1,1), 'Helvetica-Bold'),
@@ -410,60 +472,61 @@ def generate_acord_application():
     ]))
     story.append(sig_table)
 
-    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    write_pdf(path, pdf_bytes(story))
     print(f"  Created: {path}")
 
 
 # ============================================================
 # 3. LOSS RUN REPORT
 # ============================================================
+_LOSS_SUMMARY_COLS = (0.7*inch, 0.65*inch, 0.7*inch, 0.55*inch, 0.5*inch, 0.7*inch, 0.7*inch, 0.7*inch, 0.55*inch)
+_CLAIM_KV_COLS = (1.4*inch, 5.1*inch)
+_FIN_COLS = (2.1*inch, 2.2*inch, 2.2*inch)
+
 def generate_loss_run_report():
     path = os.path.join(OUT_DIR, 'Loss_Run_Report_5Year_Acme_Manufacturing.pdf')
-    doc = SimpleDocTemplate(path, pagesize=letter,
-        topMargin=0.6*inch, bottomMargin=0.7*inch,
-        leftMargin=0.75*inch, rightMargin=0.75*inch)
     story = []
 
-    story.append(header_table([
+    story.append(header_table((
         'Loss Run Report — 5 Year History',
         'Prepared: 02/15/2026  |  Valued as of: 01/31/2026'
-    ]))
+    )))
     story.append(Spacer(1, 6))
     story.append(HRFlowable(width="100%", thickness=2, color=AIG_BLUE))
     story.append(Spacer(1, 14))
 
     story.append(Paragraph('INSURED INFORMATION', styles['SectionHead']))
-    story.append(kv_table([
-        ['Named Insured:', 'Acme Manufacturing, Inc.'],
-        ['Policy Numbers:', 'GL: AIG-GL-2025-31847  |  Property: AIG-CP-2025-31848'],
-        ['Lines Covered:', 'General Liability, Products Liability, Commercial Property'],
-        ['Report Period:', '02/01/2021 — 01/31/2026 (60 months)'],
-        ['Prepared By:', 'AIG Claims Division — Loss Analytics Unit'],
-    ]))
+    story.append(kv_table((
+        ('Named Insured:', 'Acme Manufacturing, Inc.'),
+        ('Policy Numbers:', 'GL: AIG-GL-2025-31847  |  Property: AIG-CP-2025-31848'),
+        ('Lines Covered:', 'General Liability, Products Liability, Commercial Property'),
+        ('Report Period:', '02/01/2021 — 01/31/2026 (60 months)'),
+        ('Prepared By:', 'AIG Claims Division — Loss Analytics Unit'),
+    )))
     story.append(Spacer(1, 12))
 
     # Summary by year
     story.append(Paragraph('LOSS SUMMARY BY POLICY YEAR', styles['SectionHead']))
     story.append(styled_table(
-        ['Policy Year', 'Line', 'Earned\nPremium', 'Claims\nReported', 'Claims\nOpen', 'Paid\nLosses', 'Reserves', 'Total\nIncurred', 'Loss\nRatio'],
-        [
-            ['2025-26', 'GL', '$142,000', '3', '2', '$48,200', '$85,000', '$133,200', '93.8%'],
-            ['2025-26', 'Prod Liab', '$96,000', '1', '1', '$0', '$175,000', '$175,000', '182.3%'],
-            ['2025-26', 'Property', '$188,000', '1', '0', '$22,400', '$0', '$22,400', '11.9%'],
-            ['2024-25', 'GL', '$135,000', '5', '0', '$124,600', '$0', '$124,600', '92.3%'],
-            ['2024-25', 'Prod Liab', '$91,000', '2', '0', '$218,400', '$0', '$218,400', '239.1%'],
-            ['2024-25', 'Property', '$178,000', '2', '0', '$67,800', '$0', '$67,800', '38.1%'],
-            ['2023-24', 'GL', '$128,000', '2', '0', '$31,200', '$0', '$31,200', '24.4%'],
-            ['2023-24', 'Prod Liab', '$86,000', '0', '0', '$0', '$0', '$0', '0.0%'],
-            ['2023-24', 'Property', '$170,000', '1', '0', '$14,500', '$0', '$14,500', '8.5%'],
-            ['2022-23', 'GL', '$122,000', '4', '0', '$89,700', '$0', '$89,700', '73.5%'],
-            ['2022-23', 'Prod Liab', '$82,000', '1', '0', '$142,300', '$0', '$142,300', '173.5%'],
-            ['2022-23', 'Property', '$164,000', '0', '0', '$0', '$0', '$0', '0.0%'],
-            ['2021-22', 'GL', '$118,000', '2', '0', '$18,900', '$0', '$18,900', '16.0%'],
-            ['2021-22', 'Prod Liab', '$78,000', '0', '0', '$0', '$0', '$0', '0.0%'],
-            ['2021-22', 'Property', '$158,000', '1', '0', '$8,200', '$0', '$8,200', '5.2%'],
-        ],
-        col_widths=[0.7*inch, 0.65*inch, 0.7*inch, 0.55*inch, 0.5*inch, 0.7*inch, 0.7*inch, 0.7*inch, 0.55*inch]
+        ('Policy Year', 'Line', 'Earned\nPremium', 'Claims\nReported', 'Claims\nOpen', 'Paid\nLosses', 'Reserves', 'Total\nIncurred', 'Loss\nRatio'),
+        (
+            ('2025-26', 'GL', '$142,000', '3', '2', '$48,200', '$85,000', '$133,200', '93.8%'),
+            ('2025-26', 'Prod Liab', '$96,000', '1', '1', '$0', '$175,000', '$175,000', '182.3%'),
+            ('2025-26', 'Property', '$188,000', '1', '0', '$22,400', '$0', '$22,400', '11.9%'),
+            ('2024-25', 'GL', '$135,000', '5', '0', '$124,600', '$0', '$124,600', '92.3%'),
+            ('2024-25', 'Prod Liab', '$91,000', '2', '0', '$218,400', '$0', '$218,400', '239.1%'),
+            ('2024-25', 'Property', '$178,000', '2', '0', '$67,800', '$0', '$67,800', '38.1%'),
+            ('2023-24', 'GL', '$128,000', '2', '0', '$31,200', '$0', '$31,200', '24.4%'),
+            ('2023-24', 'Prod Liab', '$86,000', '0', '0', '$0', '$0', '$0', '0.0%'),
+            ('2023-24', 'Property', '$170,000', '1', '0', '$14,500', '$0', '$14,500', '8.5%'),
+            ('2022-23', 'GL', '$122,000', '4', '0', '$89,700', '$0', '$89,700', '73.5%'),
+            ('2022-23', 'Prod Liab', '$82,000', '1', '0', '$142,300', '$0', '$142,300', '173.5%'),
+            ('2022-23', 'Property', '$164,000', '0', '0', '$0', '$0', '$0', '0.0%'),
+            ('2021-22', 'GL', '$118,000', '2', '0', '$18,900', '$0', '$18,900', '16.0%'),
+            ('2021-22', 'Prod Liab', '$78,000', '0', '0', '$0', '$0', '$0', '0.0%'),
+            ('2021-22', 'Property', '$158,000', '1', '0', '$8,200', '$0', '$8,200', '5.2%'),
+        ),
+        col_widths=_LOSS_SUMMARY_COLS
     ))
 
     story.append(PageBreak())
@@ -519,28 +582,20 @@ def generate_loss_run_report():
 
     for cl in claims:
         story.append(Paragraph(f'Claim: {cl["num"]}', styles['SubSection']))
-        story.append(kv_table([
-            ['Date of Loss:', cl['dol']],
-            ['Date Reported:', cl['dor']],
-            ['Line of Business:', cl['line']],
-            ['Claimant:', cl['claimant']],
-            ['Status:', cl['status']],
-        ], col_widths=[1.4*inch, 5.1*inch]))
+        story.append(kv_table((
+            ('Date of Loss:', cl['dol']),
+            ('Date Reported:', cl['dor']),
+            ('Line of Business:', cl['line']),
+            ('Claimant:', cl['claimant']),
+            ('Status:', cl['status']),
+        ), col_widths=_CLAIM_KV_COLS))
         story.append(Paragraph(f'<b>Description:</b> {cl["desc"]}', styles['BodyText2']))
-        fin_data = [
-            ['Paid to Date', 'Outstanding Reserves', 'Total Incurred'],
-            [cl['paid'], cl['reserve'], cl['total']],
-        ]
-        ft = Table(fin_data, colWidths=[2.1*inch, 2.2*inch, 2.2*inch])
-        ft.setStyle(TableStyle([
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,-1), 9),
-            ('BACKGROUND', (0,0), (-1,0), LIGHT_BLUE),
-            ('GRID', (0,0), (-1,-1), 0.5, BORDER_GRAY),
-            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ('TOPPADDING', (0,0), (-1,-1), 5),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 5),
-        ]))
+        fin_data = (
+            ('Paid to Date', 'Outstanding Reserves', 'Total Incurred'),
+            (cl['paid'], cl['reserve'], cl['total']),
+        )
+        ft = Table(fin_data, colWidths=_FIN_COLS)
+        ft.setStyle(_FIN_TABLE_STYLE)
         story.append(ft)
         story.append(Spacer(1, 10))
 
@@ -549,13 +604,22 @@ def generate_loss_run_report():
     story.append(Spacer(1, 6))
     story.append(Paragraph('This loss run report is provided for informational purposes only and does not constitute a waiver of any policy terms, conditions, or exclusions. All figures are subject to change pending final claim adjudication.', styles['SmallGray']))
 
-    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    write_pdf(path, pdf_bytes(story))
     print(f"  Created: {path}")
 
 
+GENERATORS = (
+    generate_commercial_property_policy,
+    generate_acord_application,
+    generate_loss_run_report,
+)
+
+
 if __name__ == '__main__':
     print("Generating PDF documents...")
-    generate_commercial_property_policy()
-    generate_acord_application()
-    generate_loss_run_report()
+    # Each build is CPU-bound layout and the generators share only the
+    # stylesheet and colour constants, which every worker inherits as-is.
+    with ProcessPoolExecutor(max_workers=len(GENERATORS)) as pool:
+        for future in [pool.submit(fn) for fn in GENERATORS]:
+            future.result()
     print("Done — all PDFs generated.")